@@ -1,10 +1,39 @@
-import json, sys, time, requests
+import asyncio, http.cookiejar, json, sys, requests
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter_ns
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse, urlsplit
 from UI import start_ui
 
+try:
+    # Optional C JSON parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional streaming parser for large Postman collections
+    import ijson
+except ImportError:
+    ijson = None
+
 __version__ = "1.0.0"
 __author__ = "Firesands Auth Matrix Team"
 
 AUTHMATRIX_SHEBANG = "#!AUTHMATRIX"
+AUTHMATRIX_SHEBANG_BYTES = AUTHMATRIX_SHEBANG.encode("ascii")
+DEFAULT_MAX_CONCURRENCY = 20
+REQUEST_TIMEOUT = 30  # seconds
+STATUS_BADGES = {"PASS": "✅ ", "SKIP": "⏭️ ", "FAIL": "❌ "}
+
+# Shared session so keep-alive connections and TLS sessions are reused
+# across every (endpoint, role) check instead of reconnecting per request.
+_SESSION = requests.Session()
+# Never store cookies: a Set-Cookie seen by one role must not leak into another's checks
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 def show_help():
     """Show command line help"""
@@ -30,35 +59,96 @@ def show_help():
 def detect_file_type(file_path):
     """Detect if file is authmatrix format (has shebang) or postman format"""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            first_line = f.readline().strip()
-            return "authmatrix" if first_line == AUTHMATRIX_SHEBANG else "postman"
+        # Only the first few bytes can match, so skip decoding and stop
+        # reading long (e.g. minified) first lines early
+        with open(file_path, "rb") as f:
+            first_line = f.readline(64).strip()
+            return "authmatrix" if first_line == AUTHMATRIX_SHEBANG_BYTES else "postman"
     except Exception:
         return "unknown"
 
 def load_and_convert_spec(file_path):
     """Load spec and convert from postman to authmatrix format if needed"""
-    file_type = detect_file_type(file_path)
-    
-    with open(file_path, "r", encoding="utf-8") as f:
+    with open(file_path, "rb") as f:
+        # The shebang can only be on the first line, so a short peek is
+        # enough to tell the formats apart without a second open
+        head = f.read(64)
+        first_line = head.split(b"\n", 1)[0]
+        if first_line.strip() == AUTHMATRIX_SHEBANG_BYTES:
+            # Skip the shebang line and parse JSON
+            f.seek(len(first_line) + 1)
+            return _freeze_status_lists(_json_loads(f.read()))
+        
+        # Convert postman collection to authmatrix format
+        if ijson is not None:
+            f.seek(0)
+            try:
+                return _stream_postman(f)
+            except ijson.JSONError:
+                # Fall through so the full parse reports a json.JSONDecodeError
+                pass
+        f.seek(0)
         content = f.read()
     
-    if file_type == "authmatrix":
-        # Skip the shebang line and parse JSON
-        lines = content.splitlines()
-        json_content = "\n".join(lines[1:]) if lines[0].strip() == AUTHMATRIX_SHEBANG else content
-        return json.loads(json_content)
-    elif file_type == "postman":
-        # Convert postman collection to authmatrix format
-        postman_data = json.loads(content)
-        return convert_postman_to_authmatrix(postman_data)
-    else:
-        # Try to parse as JSON and guess format
-        data = json.loads(content)
-        if "info" in data and "item" in data:
-            return convert_postman_to_authmatrix(data)
-        else:
-            return data
+    return convert_postman_to_authmatrix(_json_loads(content))
+
+def _freeze_status_lists(spec):
+    """Turn list-valued expected statuses into frozensets for O(1) membership checks"""
+    if not isinstance(spec, dict):
+        return spec
+    for ep in spec.get("endpoints", []):
+        for expect in (ep.get("expect") or {}).values():
+            allowed = expect.get("status") if isinstance(expect, dict) else None
+            if isinstance(allowed, list):
+                try:
+                    expect["status"] = frozenset(allowed)
+                except TypeError:
+                    pass  # unhashable entries; leave the list as-is
+    return spec
+
+def _stream_postman(f):
+    """Convert a Postman collection from a binary file without loading the whole document.
+
+    Top-level items are pulled one at a time with ijson, so peak memory is
+    bounded by the largest top-level folder instead of the whole file.
+    """
+    auth = None
+    base_url = ""
+    endpoints = []
+    # One pass picks up both the collection auth and the top-level items,
+    # whichever order they appear in
+    for prefix, value in _iter_values_at(f, ("auth", "item.item")):
+        if prefix == "auth":
+            auth = value
+            continue
+        wrapper = {"item": [value]}
+        if not base_url:
+            base_url = extract_base_url_from_postman(wrapper)
+        endpoints.extend(extract_requests_from_postman(wrapper))
+    
+    authmatrix_spec = convert_postman_to_authmatrix({} if auth is None else {"auth": auth})
+    authmatrix_spec["base_url"] = base_url
+    authmatrix_spec["endpoints"] = endpoints
+    return authmatrix_spec
+
+def _iter_values_at(f, prefixes):
+    """Yield (prefix, value) for every JSON value found at one of the ijson
+    prefixes, building each value as its events go by in a single parse."""
+    builder = None
+    current = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is None:
+            if prefix not in prefixes or event in ("map_key", "end_map", "end_array"):
+                continue
+            if event not in ("start_map", "start_array"):
+                yield prefix, value
+                continue
+            builder = ijson.ObjectBuilder()
+            current = prefix
+        builder.event(event, value)
+        if prefix == current and event in ("end_map", "end_array"):
+            yield current, builder.value
+            builder = None
 
 def convert_postman_to_authmatrix(postman_data):
     """Convert a Postman collection to AuthMatrix format"""
@@ -98,10 +188,10 @@ def extract_base_url_from_postman(postman_data):
             if isinstance(url_info, str):
                 # Simple string URL
                 try:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url_info)
-                    return f"{parsed.scheme}://{parsed.netloc}"
-                except:
+                    # urlsplit skips the ;params parsing urlparse does
+                    parsed = urlsplit(url_info)
+                    return parsed.scheme + "://" + parsed.netloc
+                except ValueError:
                     pass
             elif isinstance(url_info, dict) and "host" in url_info:
                 # Object format URL
@@ -110,10 +200,7 @@ def extract_base_url_from_postman(postman_data):
                     protocol = url_info.get("protocol", "https")
                     port = url_info.get("port", "")
                     host = ".".join(host_parts)
-                    if port:
-                        return f"{protocol}://{host}:{port}"
-                    else:
-                        return f"{protocol}://{host}"
+                    return f"{protocol}://{host}:{port}" if port else f"{protocol}://{host}"
         
         # Check nested items
         if "item" in item:
@@ -123,11 +210,23 @@ def extract_base_url_from_postman(postman_data):
     
     return ""
 
+_END = object()
+
 def extract_requests_from_postman(postman_data, path_prefix=""):
-    """Extract requests from postman collection recursively"""
+    """Extract requests from postman collection, walking nested folders in order"""
     requests = []
+    _urlparse = urlparse
     
-    for item in postman_data.get("item", []):
+    # Explicit stack of (item iterator, folder prefix) instead of recursion,
+    # so deeply nested collections can't hit the recursion limit
+    stack = [(iter(postman_data.get("item", [])), path_prefix)]
+    while stack:
+        items, prefix = stack[-1]
+        item = next(items, _END)
+        if item is _END:
+            stack.pop()
+            continue
+        
         if "request" in item:
             # This is a request item
             request = item["request"]
@@ -139,10 +238,8 @@ def extract_requests_from_postman(postman_data, path_prefix=""):
             
             if isinstance(url_info, str):
                 try:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url_info)
-                    path = parsed.path or "/"
-                except:
+                    path = _urlparse(url_info).path or "/"
+                except ValueError:
                     path = "/"
             elif isinstance(url_info, dict):
                 path_parts = url_info.get("path", [])
@@ -164,76 +261,129 @@ def extract_requests_from_postman(postman_data, path_prefix=""):
         elif "item" in item:
             # This is a folder with nested items
             folder_name = item.get("name", "")
-            nested_prefix = f"{path_prefix}/{folder_name}" if folder_name else path_prefix
-            nested_requests = extract_requests_from_postman(item, nested_prefix)
-            requests.extend(nested_requests)
+            nested_prefix = f"{prefix}/{folder_name}" if folder_name else prefix
+            stack.append((iter(item.get("item", [])), nested_prefix))
     
     return requests
 
-def run_spec(spec):
-    results = {}
+def _build_role_headers(spec):
+    """Build each role's request headers once; auth doesn't vary per endpoint"""
+    default_headers = spec.get("default_headers", {})
+    role_headers = {}
+    for role, roleSpec in spec["roles"].items():
+        auth = roleSpec.get("auth", {})
+        if auth.get("type") == "bearer":
+            role_headers[role] = {**default_headers, "Authorization": f"Bearer {auth.get('token')}"}
+        else:
+            # No overlay needed; requests only reads the mapping
+            role_headers[role] = default_headers
+    return role_headers
+
+def _run_check(method, url, headers, expect):
+    """Issue one (endpoint, role) request and return its result record.
+
+    headers is shared between checks for the same role and must not be mutated.
+    """
+    # Run request
+    start = perf_counter_ns()
+    try:
+        r = _SESSION.request(method, url, headers=headers, timeout=REQUEST_TIMEOUT)
+        latency = (perf_counter_ns() - start) // 1_000_000
+    except Exception as e:
+        return {"status": "FAIL", "error": str(e)}
+
+    # Check
+    allowed = expect.get("status")
+    if isinstance(allowed, (list, frozenset)):
+        ok = r.status_code in allowed
+    else:
+        ok = r.status_code == allowed
+
+    if not ok:
+        return {"status": "FAIL", "http": r.status_code}
+    return {"status": "PASS", "http": r.status_code, "latency_ms": latency}
+
+async def run_spec_async(spec, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """Run every (endpoint, role) check concurrently.
+
+    requests is blocking, so each call is dispatched to a thread pool and
+    the whole matrix is collected with asyncio.gather. At most
+    max_concurrency requests are in flight at once so large specs don't
+    flood the target with connections.
+    """
+    max_concurrency = max(1, max_concurrency)
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max_concurrency)
+    # Dedicated pool: the loop's default executor is capped at cpu_count + 4
+    # workers, which would silently throttle I/O-bound checks below the limit
+    pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="authmatrix")
+
+    async def bounded(*args):
+        async with sem:
+            return await loop.run_in_executor(pool, _run_check, *args)
+
+    base = spec.get("base_url", "").rstrip("/")
+    role_headers = _build_role_headers(spec)
+    roles = list(spec["roles"])
+
+    # Flat (name, role, record) list in spec order; None marks a pending check
+    names = []
+    entries = []
+    checks = []
     for ep in spec["endpoints"]:
         name = ep.get("name") or ep["path"]
-        results[name] = {}
-        for role, roleSpec in spec["roles"].items():
-            expect = ep.get("expect", {}).get(role)
+        method = ep.get("method", "GET")
+        url = base + ep["path"]
+        names.append(name)
+        expect_map = ep.get("expect") or {}
+        if not expect_map:
+            # Nothing configured for this endpoint: every role is skipped
+            entries.extend((name, role, {"status": "SKIP"}) for role in roles)
+            continue
+        for role in roles:
+            expect = expect_map.get(role)
             if not expect:
-                results[name][role] = {"status": "SKIP"}
-                continue
-
-            # Build request
-            url = spec["base_url"].rstrip("/") + ep["path"]
-            headers = dict(spec.get("default_headers", {}))
-            auth = roleSpec.get("auth", {})
-            if auth.get("type") == "bearer":
-                headers["Authorization"] = f"Bearer {auth.get('token')}"
-
-            # Run request
-            start = time.time()
-            try:
-                r = requests.request(ep.get("method", "GET"), url, headers=headers)
-                latency = int((time.time() - start) * 1000)
-            except Exception as e:
-                results[name][role] = {"status": "FAIL", "error": str(e)}
+                entries.append((name, role, {"status": "SKIP"}))
                 continue
+            entries.append((name, role, None))
+            checks.append(bounded(method, url, role_headers[role], expect))
 
-            # Check
-            allowed = expect.get("status")
-            if isinstance(allowed, list):
-                ok = r.status_code in allowed
-            else:
-                ok = r.status_code == allowed
-
-            if not ok:
-                results[name][role] = {"status": "FAIL", "http": r.status_code}
-            else:
-                results[name][role] = {"status": "PASS", "http": r.status_code, "latency_ms": latency}
+    # gather keeps submission order, so records line up with the None slots
+    try:
+        records = iter(await asyncio.gather(*checks))
+    finally:
+        pool.shutdown(wait=False)
+    results = {name: {} for name in names}
+    for name, role, record in entries:
+        results[name][role] = next(records) if record is None else record
     return results
 
+def run_spec(spec, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    return asyncio.run(run_spec_async(spec, max_concurrency))
+
 def print_matrix(results):
     # preserve role order from first endpoint
     roles = list(next(iter(results.values())).keys())
 
     # calculate widths
-    ep_width = max(20, max(len(ep) for ep in results.keys()))
+    ep_width = max(20, max(map(len, results)))
     col_width = 8  # fixed width per role cell
+    ep_cell = "{:<%d}" % ep_width
+    role_cell = ("{:<%d}" % col_width).format
 
     # header
-    header = "Endpoint".ljust(ep_width) + " " + " ".join(r.ljust(col_width) for r in roles)
-    print(header)
-    print("-" * len(header))
+    header = ep_cell.format("Endpoint") + " " + " ".join(map(role_cell, roles))
+    lines = [header, "-" * len(header)]
 
     # rows
+    badges = STATUS_BADGES
     for ep, rmap in results.items():
-        row = ep.ljust(ep_width)
+        cells = [ep_cell.format(ep)]
         for r in roles:
             res = rmap[r]
-            st = res["status"]
-            http = str(res.get("http", ""))
-            badge = "✅ " if st == "PASS" else ("⏭️ " if st == "SKIP" else "❌ ")
-            cell = f"{badge}{http}".ljust(col_width)
-            row += " " + cell
-        print(row)
+            cells.append(role_cell(badges.get(res["status"], "❌ ") + str(res.get("http", ""))))
+        lines.append(" ".join(cells))
+    print("\n".join(lines))
 
 def main():
     """Main entry point for the application"""
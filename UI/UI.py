@@ -1,85 +1,234 @@
 from __future__ import annotations
-import json, sys, time, multiprocessing, pickle, os
-from functools import partial
-from typing import Dict, Any, Optional, Callable, List
-from functools import partial
-import requests
+import hashlib, json, re, sys, time, pickle, os, queue, threading, traceback
+from functools import partial, lru_cache
+from pathlib import Path
+from collections import defaultdict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, Any, Optional, Callable, List
+import http.cookiejar
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    # Optional incremental JSON parser for large Postman collection files
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors meaning "not valid JSON" from whichever parser handled the input
+_JSON_DECODE_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
 
 from PySide6 import QtCore, QtGui, QtWidgets
-from .views.SpecStore import SpecStore
+from .views.SpecStore import SpecStore, _AUTO_CONFIG_PROMPT, _json_dumps, _json_loads
 from .views.Results import ResultsSection
-from .views.Theme import primary, secondary, background, text, border, lines, bg2
-from .views.ModernStyles import get_main_stylesheet, apply_animation_properties
+from .views.Theme import primary, lines, bg2
 from .views.ModernStyles import get_main_stylesheet, apply_animation_properties
 from .components import LogoHeader, multiline_input, show_text, TabsComponent
+from .components import EndpointTableModel, ButtonDelegate
+
+
+# Concurrent HTTP checks per run; stays within the Session's pool size
+_WORKER_THREADS = 16
+
+# Checks only look at the status code. Bodies up to this size are read so
+# the connection goes back to the pool; larger ones are never downloaded.
+_MAX_DRAINED_BODY = 64 * 1024
+
+
+def _new_worker_session() -> requests.Session:
+    """Create the pooled Session a worker reuses for every check.
+
+    Keep-alive connections carry over between endpoints and runs. Cookies
+    are never stored, so a Set-Cookie seen by one role can't leak into
+    another role's requests.
+    """
+    # requests (and urllib3 under it) is imported on the first run rather
+    # than at startup; the window doesn't need it to come up
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    # A spec targets a single base URL, so a few host pools are plenty; each
+    # one holds a connection for every check thread
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_WORKER_THREADS, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _drain_small_body(response):
+    """Read a streamed response's body unless it exceeds _MAX_DRAINED_BODY.
+
+    Fully read responses keep their keep-alive connection when closed; a
+    response abandoned part way has its connection dropped instead.
+    """
+    length = response.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > _MAX_DRAINED_BODY:
+        return
+    read = 0
+    for chunk in response.iter_content(16 * 1024):
+        read += len(chunk)
+        if read > _MAX_DRAINED_BODY:
+            return
+
+
+def _check_endpoint(session, name, role, method, url, headers, allowed, host_down):
+    """Run one endpoint/role check against the set of allowed statuses;
+    returns (name, role, result)
+
+    host_down is shared by every check in a run. Once one check can't
+    connect to the host at all, the rest fail straight away instead of
+    each waiting out its own timeout.
+    """
+    import requests
+    from urllib3.exceptions import ConnectTimeoutError
 
+    if host_down.is_set():
+        return name, role, {"status": "FAIL", "error": "Host unreachable (earlier connection failed)"}
 
-def streaming_worker_function(spec, result_queue, error_queue, stop_event):
-    """Worker function that streams results as they complete."""
+    start = time.perf_counter_ns()
     try:
-        for ep in spec["endpoints"]:
-            # Check if we should stop
-            if stop_event.is_set():
-                result_queue.put(("STOPPED", None, None, None))
-                return
+        r = session.request(method, url, headers=headers, timeout=30, stream=True)
+        with r:
+            _drain_small_body(r)
+        # Taken after the body is read, so latency covers the whole response
+        latency = (time.perf_counter_ns() - start) // 1_000_000
+    except requests.exceptions.ConnectionError as e:
+        # Refused, DNS failure or connect timeout: no request ever reached
+        # the server. Dropped connections mid-response don't count.
+        reason = getattr(e.args[0], "reason", None) if e.args else None
+        if isinstance(reason, ConnectTimeoutError):
+            host_down.set()
+        return name, role, {"status": "FAIL", "error": str(e)}
+    except Exception as e:
+        return name, role, {"status": "FAIL", "error": str(e)}
 
-            name = ep.get("name") or ep["path"]
+    if r.status_code not in allowed:
+        return name, role, {"status": "FAIL", "http": r.status_code}
+    return name, role, {"status": "PASS", "http": r.status_code, "latency_ms": latency}
 
-            for role, roleSpec in spec["roles"].items():
-                # Check if we should stop
-                if stop_event.is_set():
-                    result_queue.put(("STOPPED", None, None, None))
-                    return
 
-                expect = ep.get("expect", {}).get(role)
-                if not expect:
-                    result_queue.put(("RESULT", name, role, {"status": "SKIP"}))
-                    continue
+def streaming_worker_function(spec_bytes, results, stop_event, session, pool):
+    """Run one spec on a background thread and stream its results as they
+    complete.
 
-                # Build request
-                url = spec["base_url"].rstrip("/") + ep["path"]
-                headers = dict(spec.get("default_headers", {}))
-                auth = roleSpec.get("auth", {})
-                if auth.get("type") == "bearer":
-                    headers["Authorization"] = f"Bearer {auth.get('token')}"
-
-                # Run request
-                start = time.time()
-                try:
-                    r = requests.request(ep.get("method", "GET"), url, headers=headers, timeout=30)
-                    latency = int((time.time() - start) * 1000)
-                except Exception as e:
-                    result_queue.put(("RESULT", name, role, {"status": "FAIL", "error": str(e)}))
-                    continue
+    The spec arrives pickled (see SpecStore.pickled_spec), which gives the
+    run its own copy that edits made in the UI meanwhile can't touch. Checks
+    run concurrently on the shared thread pool; only this thread puts to the
+    results queue.
 
-                # Check
+    Every run ends with exactly one DONE, STOPPED or ERROR message.
+    """
+    try:
+        spec = pickle.loads(spec_bytes)
+        base_url = spec["base_url"].rstrip("/")
+        default_headers = spec.get("default_headers", {})
+
+        # Headers only depend on the role, so build them once per role
+        role_headers = {}
+        for role, roleSpec in spec["roles"].items():
+            headers = dict(default_headers)
+            auth = roleSpec.get("auth", {})
+            if auth.get("type") == "bearer":
+                headers["Authorization"] = f"Bearer {auth.get('token')}"
+            role_headers[role] = headers
+
+        # Every URL in a run shares the spec's base URL, hence one flag
+        host_down = threading.Event()
+        pending = set()
+        for ep in spec["endpoints"]:
+            name = ep.get("name") or ep["path"]
+            url = base_url + ep["path"]
+            method = ep.get("method", "GET")
+            expect_map = ep.get("expect", {})
+            for role in spec["roles"]:
+                expect = expect_map.get(role)
+                if not expect:
+                    results.put(("RESULT", name, role, {"status": "SKIP"}))
+                    continue
                 allowed = expect.get("status")
-                if isinstance(allowed, list):
-                    ok = r.status_code in allowed
+                if isinstance(allowed, (list, tuple, frozenset)):
+                    allowed = frozenset(allowed)
                 else:
-                    ok = r.status_code == allowed
-
-                if not ok:
-                    result_queue.put(("RESULT", name, role, {"status": "FAIL", "http": r.status_code}))
-                else:
-                    result_queue.put(("RESULT", name, role, {"status": "PASS", "http": r.status_code, "latency_ms": latency}))
+                    allowed = frozenset((allowed,))
+                pending.add(pool.submit(
+                    _check_endpoint, session, name, role, method, url,
+                    role_headers[role], allowed, host_down,
+                ))
+
+        while pending:
+            # Wake up periodically so a stop request isn't stuck behind a slow check
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                results.put(("RESULT",) + future.result())
+            if stop_event.is_set():
+                for future in pending:
+                    future.cancel()
+                results.put(("STOPPED", None, None, None))
+                return
 
         # Signal completion
-        result_queue.put(("DONE", None, None, None))
+        results.put(("DONE", None, None, None))
     except Exception as e:
-        error_queue.put(str(e))
+        # Keep the traceback so failed runs can be diagnosed from the UI
+        results.put(("ERROR", None, None, (str(e), traceback.format_exc())))
 
 
-def worker_process_function(runner_func, spec, result_queue, error_queue):
-    """Worker function that runs in a separate process."""
-    try:
-        # Execute the runner function with the spec
-        result = runner_func(spec)
-        if not isinstance(result, dict):
-            raise RuntimeError("Runner returned non-dict")
-        result_queue.put(result)
-    except Exception as e:
-        error_queue.put(str(e))
+@lru_cache(maxsize=None)
+def _app_icon() -> QtGui.QIcon:
+    """Resolve the favicon once and share a single QIcon between windows.
+
+    Prefers .ico for better multi-size support on Windows and also looks
+    inside a PyInstaller bundle. Returns a null icon if none is found.
+    """
+    for ext in (".ico", ".png"):
+        # When running from source
+        candidates = [Path(__file__).parent / "assets" / f"favicon{ext}"]
+        # When running from PyInstaller bundle
+        if hasattr(sys, "_MEIPASS"):
+            candidates.append(Path(sys._MEIPASS) / "UI" / "assets" / f"favicon{ext}")
+        for candidate_path in candidates:
+            if candidate_path.exists():
+                return QtGui.QIcon(str(candidate_path))
+    return QtGui.QIcon()
+
+
+class StreamListener(QtCore.QObject):
+    """Blocks on the worker's results queue in a background thread and
+    relays its messages to the GUI thread through a queued signal.
+
+    Messages that are already waiting are relayed together as one list, so
+    a burst of results costs the GUI thread a single slot call and repaint.
+    """
+
+    messages = QtCore.Signal(object)
+
+    TERMINAL = ("DONE", "STOPPED", "ERROR")
+
+    # Upper bound on messages relayed in one batch
+    MAX_BATCH = 256
+
+    def __init__(self, results, parent=None):
+        super().__init__(parent)
+        self._results = results
+        self._thread = threading.Thread(target=self._listen, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _listen(self):
+        while True:
+            batch = [self._results.get()]
+            try:
+                while batch[-1][0] not in self.TERMINAL and len(batch) < self.MAX_BATCH:
+                    batch.append(self._results.get_nowait())
+            except queue.Empty:
+                pass
+            self.messages.emit(batch)
+            if batch[-1][0] in self.TERMINAL:
+                return
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -111,12 +260,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.store = SpecStore()
         self.results: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
 
-        # Multiprocessing attributes for streaming
-        self.process: Optional[multiprocessing.Process] = None
-        self.result_queue: Optional[multiprocessing.Queue] = None
-        self.error_queue: Optional[multiprocessing.Queue] = None
-        self.stop_event: Optional[multiprocessing.Event] = None
-        self.poll_timer: Optional[QtCore.QTimer] = None
+        # Streaming runs happen on a background thread. The Session and the
+        # check pool are created on the first run and kept for later ones.
+        self.session: Optional[requests.Session] = None
+        self.pool: Optional[ThreadPoolExecutor] = None
+        self.worker: Optional[threading.Thread] = None
+        self.stop_event: Optional[threading.Event] = None
+        self.listener: Optional[StreamListener] = None
 
         # Track streaming results
         self.streaming_results: Dict[str, Dict[str, Dict[str, Any]]] = {}
@@ -124,9 +274,6 @@ class MainWindow(QtWidgets.QMainWindow):
         # Apply modern stylesheet
         self.setStyleSheet(get_main_stylesheet())
 
-        # Apply modern stylesheet
-        self.setStyleSheet(get_main_stylesheet())
-
         # Header
         self.header = LogoHeader()
         self.addToolBarBreak()
@@ -173,7 +320,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.baseUrlEdit = QtWidgets.QLineEdit()
         self.baseUrlEdit.setPlaceholderText("http://localhost:3000")
-        self.baseUrlEdit.textChanged.connect(self.store.set_base_url)
+        # Coalesce keystrokes (and long pastes) into a single store update
+        self._url_debounce = QtCore.QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(150)
+        self._url_debounce.timeout.connect(self._commit_base_url)
+        self.baseUrlEdit.textChanged.connect(self._url_debounce.start)
         apply_animation_properties(self.baseUrlEdit)
         vlayout.addWidget(self.baseUrlEdit)
 
@@ -265,35 +417,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _set_window_icon(self):
         """Set the window icon from assets folder"""
-        import os
-        from pathlib import Path
-
-
-        # Try to find the icon file
-        # Prefer .ico on Windows for better multi-size support
-        icon_extensions = [".ico", ".png"]
-        icon_path = None
-
-
-        for ext in icon_extensions:
-            # When running from source
-            candidate_path = Path(__file__).parent / "assets" / f"favicon{ext}"
-            if candidate_path.exists():
-                icon_path = candidate_path
-                break
-
-
-            # When running from PyInstaller bundle
-            if hasattr(sys, "_MEIPASS"):
-                candidate_path = Path(sys._MEIPASS) / "UI" / "assets" / f"favicon{ext}"
-                if candidate_path.exists():
-                    icon_path = candidate_path
-                    break
-
-
-        if icon_path:
-            icon = QtGui.QIcon(str(icon_path))
-            # Set window icon
+        icon = _app_icon()
+        if not icon.isNull():
             self.setWindowIcon(icon)
             # Also set the application icon for taskbar
             app = QtWidgets.QApplication.instance()
@@ -303,39 +428,18 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_spec_changed(self):
         """Update UI elements when the spec changes"""
         # Update base URL field without triggering textChanged signal
+        if self._url_debounce.isActive():
+            return  # The field holds a newer edit that hasn't been committed
         base_url = self.store.spec.get("base_url", "")
         if self.baseUrlEdit.text() != base_url:
-            # Temporarily disconnect signal to avoid feedback loop
-            self.baseUrlEdit.textChanged.disconnect()
-            self.baseUrlEdit.setText(base_url)
-            self.baseUrlEdit.textChanged.connect(self.store.set_base_url)
-
-    # Theme application (apply static colors from Theme.py)
-    def _apply_theme(self, color: QtGui.QColor):
-        self.themeColor = color
-        self.setStyleSheet(
-            f"""
-            QWidget {{
-                background-color: {background};
-                color: {text};
-            }}
-            QPushButton {{
-                background-color: {primary};
-                color: {text};
-                border: 1px solid {border};
-                padding: 6px 10px;
-                border-radius: 4px;
-            }}
-            QToolBar {{
-                background: {background};
-                border: none;
-            }}
-            QHeaderView::section {{
-                background: {secondary};
-                color: {text};
-            }}
-        """
-        )
+            # Restores the previous blocked state even if setText raises
+            with QtCore.QSignalBlocker(self.baseUrlEdit):
+                self.baseUrlEdit.setText(base_url)
+
+    def _commit_base_url(self):
+        """Push the base URL field into the store, flushing any pending edit"""
+        self._url_debounce.stop()
+        self.store.set_base_url(self.baseUrlEdit.text())
 
     # Import/Export
     def _import_spec(self):
@@ -348,10 +452,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _has_configured_expectations(self) -> bool:
         """Check if any endpoints have configured expectations"""
-        for endpoint in self.store.spec.get("endpoints", []):
-            if endpoint.get("expect"):
-                return True
-        return False
+        return self.store.has_configured_expectations()
 
     def _show_postman_configuration_dialog(self):
         """Show dialog to configure auth levels and behavior for imported Postman collection"""
@@ -366,6 +467,8 @@ class MainWindow(QtWidgets.QMainWindow):
             )
 
     def _export_spec(self):
+        if self._url_debounce.isActive():
+            self._commit_base_url()
         # Show export options dialog
         dialog = ExportDialog(self.store, self)
         dialog.exec()
@@ -373,6 +476,8 @@ class MainWindow(QtWidgets.QMainWindow):
     # Run
     def _run(self):
         """Start running tests with streaming results"""
+        if self._url_debounce.isActive():
+            self._commit_base_url()
         if not self.store.spec.get("base_url"):
             QtWidgets.QMessageBox.warning(self, "Run", "Base URL is required")
             return
@@ -383,13 +488,15 @@ class MainWindow(QtWidgets.QMainWindow):
         # Set button to running state
         self.header.set_running_state(True)
 
-        # Initialize streaming results with empty structure
-        self.streaming_results = {}
-        for ep in self.store.spec.get("endpoints", []):
-            name = ep.get("name") or ep["path"]
-            self.streaming_results[name] = {}
-            for role in self.store.spec.get("roles", {}).keys():
-                self.streaming_results[name][role] = {"status": "⏳"}  # Pending
+        # Initialize streaming results with every cell pending. Results
+        # replace cells rather than mutate them, so all cells can share one
+        # placeholder dict.
+        pending = {"status": "⏳"}
+        roles = list(self.store.spec.get("roles", {}))
+        self.streaming_results = {
+            (ep.get("name") or ep["path"]): dict.fromkeys(roles, pending)
+            for ep in self.store.spec.get("endpoints", [])
+        }
 
         # Initialize results table with empty/pending state
         self.resultsView.render(self.streaming_results)
@@ -397,22 +504,44 @@ class MainWindow(QtWidgets.QMainWindow):
         # Switch to Results tab
         self.tabs.setCurrentIndex(3)  # Results tab is typically index 3
 
-        # Create multiprocessing resources
-        self.result_queue = multiprocessing.Queue()
-        self.error_queue = multiprocessing.Queue()
-        self.stop_event = multiprocessing.Event()
-
-        # Create and start worker process
-        self.process = multiprocessing.Process(
+        # Fresh queue and stop flag per run, so a stopped run that is still
+        # winding down can't leak into this one
+        self._ensure_worker()
+        results = queue.Queue()
+        self.stop_event = threading.Event()
+        self.worker = threading.Thread(
             target=streaming_worker_function,
-            args=(self.store.spec, self.result_queue, self.error_queue, self.stop_event),
+            args=(self.store.pickled_spec(), results, self.stop_event, self.session, self.pool),
+            daemon=True,
         )
-        self.process.start()
 
-        # Set up timer to poll for streaming results
-        self.poll_timer = QtCore.QTimer()
-        self.poll_timer.timeout.connect(self._poll_streaming_results)
-        self.poll_timer.start(100)  # Poll every 100ms
+        # Results are pushed to the GUI thread as they arrive instead of polled
+        self.listener = StreamListener(results, self)
+        self.listener.messages.connect(self._on_stream_messages)
+        self.listener.start()
+        self.worker.start()
+
+    def _ensure_worker(self):
+        """Create the shared Session and check pool unless they already exist"""
+        if self.pool is None:
+            self.session = _new_worker_session()
+            self.pool = ThreadPoolExecutor(max_workers=_WORKER_THREADS, thread_name_prefix="check")
+
+    def _shutdown_worker(self):
+        """Stop any running checks and release the Session and pool without blocking"""
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+        if self.pool is not None:
+            # Queued checks are dropped; ones already in flight end with
+            # their request timeout
+            self.pool.shutdown(wait=False)
+            self.session.close()
+
+        self.session = None
+        self.pool = None
+        self.worker = None
+        self.stop_event = None
 
     def _stop_run(self):
         """Stop the currently running tests"""
@@ -420,56 +549,32 @@ class MainWindow(QtWidgets.QMainWindow):
             self.stop_event.set()
         self.statusBar().showMessage("Stopping tests...", 2000)
 
-    def _poll_streaming_results(self):
-        """Poll for streaming results from the worker process"""
-        if not self.process:
-            return
+    def _on_stream_messages(self, batch):
+        """Handle a batch of messages relayed from the worker thread"""
+        if self.listener is None or self.sender() is not self.listener:
+            return  # Left over from a run that was already cleaned up
 
-        # Process all available results in the queue
-        while not self.result_queue.empty():
-            try:
-                msg_type, endpoint_name, role, result = self.result_queue.get_nowait()
+        updates = []
+        for msg_type, endpoint_name, role, result in batch:
+            if msg_type == "RESULT" and endpoint_name in self.streaming_results:
+                self.streaming_results[endpoint_name][role] = result
+                updates.append((endpoint_name, role, result))
+        if updates:
+            self.resultsView.update_results(updates)
 
-                if msg_type == "RESULT":
-                    # Update the specific result
-                    if endpoint_name in self.streaming_results:
-                        self.streaming_results[endpoint_name][role] = result
-                        self.resultsView.update_result(endpoint_name, role, result)
+        # The listener ends a batch at the first terminal message
+        msg_type, endpoint_name, role, result = batch[-1]
 
-                elif msg_type == "DONE":
-                    # All tests completed
-                    self._on_streaming_finished()
-                    return
-
-                elif msg_type == "STOPPED":
-                    # Tests were stopped
-                    self._on_streaming_stopped()
-                    return
-
-            except Exception as e:
-                print(f"Error processing result: {e}")
-                continue
+        if msg_type == "DONE":
+            # All tests completed
+            self._on_streaming_finished()
 
-        # Check for errors
-        if not self.error_queue.empty():
-            error_msg = self.error_queue.get()
-            self._on_streaming_failed(error_msg)
-            return
+        elif msg_type == "STOPPED":
+            # Tests were stopped
+            self._on_streaming_stopped()
 
-        # Check if process has died unexpectedly
-        if not self.process.is_alive():
-            # Process finished, but we didn't get DONE or STOPPED message
-            # Process remaining messages in queue
-            while not self.result_queue.empty():
-                try:
-                    msg_type, endpoint_name, role, result = self.result_queue.get_nowait()
-                    if msg_type == "RESULT" and endpoint_name in self.streaming_results:
-                        self.streaming_results[endpoint_name][role] = result
-                        self.resultsView.update_result(endpoint_name, role, result)
-                except:
-                    break
-
-            self._on_streaming_finished()
+        elif msg_type == "ERROR":
+            self._on_streaming_failed(result)
 
     def _on_streaming_finished(self):
         """Handle completion of streaming tests"""
@@ -484,38 +589,30 @@ class MainWindow(QtWidgets.QMainWindow):
         self.header.set_running_state(False)
         self.statusBar().showMessage("Tests stopped by user", 3000)
 
-    def _on_streaming_failed(self, msg: str):
-        """Handle streaming test failure"""
+    def _on_streaming_failed(self, error):
+        """Handle streaming test failure; error is (message, traceback)"""
         self._cleanup_streaming()
         self.header.set_running_state(False)
-        QtWidgets.QMessageBox.critical(self, "Test Failed", msg)
+        msg, details = error
+        box = QtWidgets.QMessageBox(
+            QtWidgets.QMessageBox.Critical, "Test Failed", msg,
+            QtWidgets.QMessageBox.Ok, self,
+        )
+        box.setDetailedText(details)
+        box.exec()
         self.statusBar().clearMessage()
 
     def _cleanup_streaming(self):
-        """Clean up streaming resources"""
-        if self.poll_timer:
-            self.poll_timer.stop()
-            self.poll_timer = None
-
-        if self.process and self.process.is_alive():
-            self.process.join(timeout=1.0)
-            if self.process.is_alive():
-                self.process.terminate()
-                self.process.join()
-
-        self.process = None
-        self.result_queue = None
-        self.error_queue = None
-        self.stop_event = None
+        """Clean up streaming resources; the worker is kept for the next run"""
+        if self.listener:
+            self.listener.messages.disconnect(self._on_stream_messages)
+            self.listener = None
 
     def closeEvent(self, event):
-        """Clean up multiprocessing resources when window is closed."""
-        # Stop any running tests
-        if self.stop_event:
-            self.stop_event.set()
-
-        # Clean up streaming resources
+        """Clean up the streaming worker when the window is closed."""
+        # Clean up streaming resources and stop any running tests
         self._cleanup_streaming()
+        self._shutdown_worker()
 
         # Reset header button state
         if hasattr(self, 'header'):
@@ -524,6 +621,30 @@ class MainWindow(QtWidgets.QMainWindow):
         super().closeEvent(event)
 
 
+def _size_dialog_to_parent(dialog, width_ratio=0.7, height_ratio=0.7):
+    """Size a dialog relative to its parent window or the screen"""
+    parent = dialog.parent()
+    if parent and isinstance(parent, QtWidgets.QWidget):
+        parent_size = parent.size()
+        target_width = int(parent_size.width() * width_ratio)
+        target_height = int(parent_size.height() * height_ratio)
+    else:
+        screen = QtWidgets.QApplication.primaryScreen()
+        if screen:
+            available = screen.availableGeometry()
+            target_width = int(available.width() * width_ratio)
+            target_height = int(available.height() * height_ratio)
+        else:
+            return
+
+    # Ensure we don't go below minimum size
+    current_min = dialog.minimumSize()
+    target_width = max(target_width, current_min.width())
+    target_height = max(target_height, current_min.height())
+
+    dialog.resize(target_width, target_height)
+
+
 class PostmanConfigDialog(QtWidgets.QDialog):
     """Dialog for configuring auth levels and behavior logic for Postman imports"""
 
@@ -533,35 +654,7 @@ class PostmanConfigDialog(QtWidgets.QDialog):
         self.setWindowTitle("Configure Postman Collection")
         self.setModal(True)
         self.setMinimumSize(500, 400)
-        self._size_dialog_to_parent(0.7, 0.7)
-
-        layout = QtWidgets.QVBoxLayout(self)
-
-
-    def _size_dialog_to_parent(self, width_ratio=0.7, height_ratio=0.7):
-        """Size dialog relative to parent window or screen"""
-        if self.parent() and isinstance(self.parent(), QtWidgets.QWidget):
-            parent_size = self.parent().size()
-            target_width = int(parent_size.width() * width_ratio)
-            target_height = int(parent_size.height() * height_ratio)
-        else:
-            screen = QtWidgets.QApplication.primaryScreen()
-            if screen:
-                available = screen.availableGeometry()
-                target_width = int(available.width() * width_ratio)
-                target_height = int(available.height() * height_ratio)
-            else:
-                return
-
-
-        # Ensure we don't go below minimum size
-        current_min = self.minimumSize()
-        target_width = max(target_width, current_min.width())
-        target_height = max(target_height, current_min.height())
-
-
-        self.resize(target_width, target_height)
-
+        _size_dialog_to_parent(self, 0.7, 0.7)
 
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -583,7 +676,10 @@ class PostmanConfigDialog(QtWidgets.QDialog):
         auth_layout.addRow(add_role_btn)
 
         # List existing roles
-        self.roles_list = QtWidgets.QListWidget()
+        self._roles_model = QtCore.QStringListModel(self)
+        self.roles_list = QtWidgets.QListView()
+        self.roles_list.setModel(self._roles_model)
+        self.roles_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self._refresh_roles_list()
         auth_layout.addRow("Current Roles:", self.roles_list)
 
@@ -601,14 +697,17 @@ class PostmanConfigDialog(QtWidgets.QDialog):
         instructions.setWordWrap(True)
         endpoints_layout.addWidget(instructions)
 
-        # Endpoints table
-        self.endpoints_table = QtWidgets.QTableWidget()
-        self.endpoints_table.setColumnCount(3)
-        self.endpoints_table.setHorizontalHeaderLabels(
-            ["Endpoint", "Method", "Configure"]
-        )
-        self._refresh_endpoints_table()
+        # Endpoints table; the model only materializes visible rows and the
+        # Configure buttons are painted by a delegate instead of widgets
+        self.endpoints_model = EndpointTableModel(self.store, self)
+        self.endpoints_table = QtWidgets.QTableView()
+        self.endpoints_table.setModel(self.endpoints_model)
+        self.endpoints_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.configure_delegate = ButtonDelegate("Configure", self.endpoints_table)
+        self.configure_delegate.clicked.connect(self._configure_endpoint)
+        self.endpoints_table.setItemDelegateForColumn(2, self.configure_delegate)
         endpoints_layout.addWidget(self.endpoints_table)
+        self._columns_sized = False
 
         layout.addWidget(endpoints_group)
 
@@ -631,61 +730,14 @@ class PostmanConfigDialog(QtWidgets.QDialog):
 
         layout.addLayout(button_layout)
 
-
-    def _size_dialog_to_parent(self, width_ratio=0.7, height_ratio=0.7):
-        """Size dialog relative to parent window or screen"""
-        if self.parent() and isinstance(self.parent(), QtWidgets.QWidget):
-            parent_size = self.parent().size()
-            target_width = int(parent_size.width() * width_ratio)
-            target_height = int(parent_size.height() * height_ratio)
-        else:
-            screen = QtWidgets.QApplication.primaryScreen()
-            if screen:
-                available = screen.availableGeometry()
-                target_width = int(available.width() * width_ratio)
-                target_height = int(available.height() * height_ratio)
-            else:
-                return
-
-
-        # Ensure we don't go below minimum size
-        current_min = self.minimumSize()
-        target_width = max(target_width, current_min.width())
-        target_height = max(target_height, current_min.height())
-
-
-        self.resize(target_width, target_height)
-
     def _refresh_roles_list(self):
-        self.roles_list.clear()
-        for role_name, role_config in self.store.spec.get("roles", {}).items():
-            auth_type = role_config.get("auth", {}).get("type", "none")
-            token_info = " (with token)" if auth_type == "bearer" else ""
-            self.roles_list.addItem(f"{role_name} - {auth_type}{token_info}")
-
-    def _refresh_endpoints_table(self):
-        endpoints = self.store.spec.get("endpoints", [])
-        self.endpoints_table.setRowCount(len(endpoints))
-
-        for i, endpoint in enumerate(endpoints):
-            # Endpoint name
-            name_item = QtWidgets.QTableWidgetItem(endpoint.get("name", ""))
-            name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.endpoints_table.setItem(i, 0, name_item)
-
-            # Method
-            method_item = QtWidgets.QTableWidgetItem(endpoint.get("method", "GET"))
-            method_item.setFlags(method_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.endpoints_table.setItem(i, 1, method_item)
-
-            # Configure button
-            config_btn = QtWidgets.QPushButton("Configure")
-            config_btn.clicked.connect(
-                lambda checked, idx=i: self._configure_endpoint(idx)
-            )
-            self.endpoints_table.setCellWidget(i, 2, config_btn)
+        self._roles_model.setStringList(self.store.role_labels())
 
-        self.endpoints_table.resizeColumnsToContents()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._columns_sized:
+            self.endpoints_table.resizeColumnsToContents()
+            self._columns_sized = True
 
     def _add_role(self):
         dialog = AddRoleDialog(self)
@@ -708,11 +760,7 @@ class PostmanConfigDialog(QtWidgets.QDialog):
         reply = QtWidgets.QMessageBox.question(
             self,
             "Auto-Configure",
-            "This will set up common patterns:\n"
-            "• Public endpoints (/, /health, /status) → 200 for all roles\n"
-            "• Admin endpoints (/admin/*) → 403 for guest, 200 for admin\n"
-            "• User endpoints (/user/*, /profile) → 403 for guest, 200 for authenticated roles\n\n"
-            "Continue?",
+            _AUTO_CONFIG_PROMPT,
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
         )
 
@@ -721,34 +769,7 @@ class PostmanConfigDialog(QtWidgets.QDialog):
 
     def _apply_auto_configuration(self):
         """Apply automatic configuration patterns"""
-        public_patterns = ["/", "/health", "/status", "/info", "/version"]
-        admin_patterns = ["/admin"]
-        user_patterns = ["/user", "/profile", "/settings"]
-
-        for i, endpoint in enumerate(self.store.spec.get("endpoints", [])):
-            path = endpoint.get("path", "").lower()
-
-            # Check patterns
-            is_public = any(path.startswith(pattern) for pattern in public_patterns)
-            is_admin = any(pattern in path for pattern in admin_patterns)
-            is_user = any(pattern in path for pattern in user_patterns)
-
-            # Configure expectations
-            for role_name in self.store.spec.get("roles", {}):
-                if is_public:
-                    # Public endpoints - 200 for everyone
-                    status = 200
-                elif is_admin:
-                    # Admin endpoints - 403 for guest, 200 for admin
-                    status = 200 if role_name == "admin" else 403
-                elif is_user:
-                    # User endpoints - 403 for guest, 200 for authenticated
-                    status = 200 if role_name != "guest" else 403
-                else:
-                    # Default - 200 for admin, 403 for others
-                    status = 200 if role_name == "admin" else 403
-
-                self.store.set_endpoint_expectation(i, role_name, status=status)
+        self.store.apply_auto_configuration()
 
 
 class AddRoleDialog(QtWidgets.QDialog):
@@ -792,6 +813,24 @@ class AddRoleDialog(QtWidgets.QDialog):
         )
 
 
+# A single status code or a bracketed list of them, e.g. "200" or "[200, 201]"
+_STATUS_RE = re.compile(r"^\s*(?:\[([0-9\s,]*)\]|([0-9]+))\s*$")
+
+
+def _parse_status(text: str):
+    """Parse a status field into an int or a list of ints; raises ValueError"""
+    match = _STATUS_RE.match(text)
+    if not match:
+        raise ValueError(text)
+    codes, code = match.groups()
+    if code is not None:
+        return int(code)
+    if not codes.strip():
+        return []
+    # int() rejects the empty parts left by stray commas
+    return [int(part) for part in codes.split(",")]
+
+
 class EndpointConfigDialog(QtWidgets.QDialog):
     """Dialog for configuring individual endpoint expectations"""
 
@@ -845,36 +884,84 @@ class EndpointConfigDialog(QtWidgets.QDialog):
 
     def _save_config(self):
         """Save the configuration for this endpoint"""
+        # Validate every role before touching the store, then apply in one go
+        updates = []
         for role_name, widgets in self.role_configs.items():
             status_text = widgets["status"].text().strip()
-            if status_text:
-                try:
-                    # Try to parse as int first, then as list
-                    if status_text.startswith("[") and status_text.endswith("]"):
-                        status = json.loads(status_text)
-                    else:
-                        status = int(status_text)
-
-                    self.store.set_endpoint_expectation(
-                        self.endpoint_index, role_name, status=status
-                    )
-                except (ValueError, json.JSONDecodeError):
-                    QtWidgets.QMessageBox.warning(
-                        self,
-                        "Invalid Status",
-                        f"Invalid status code for {role_name}: {status_text}",
-                    )
-                    return
+            if not status_text:
+                continue
+            try:
+                status = _parse_status(status_text)
+            except ValueError:
+                QtWidgets.QMessageBox.warning(
+                    self,
+                    "Invalid Status",
+                    f"Invalid status code for {role_name}: {status_text}",
+                )
+                return
+            updates.append((self.endpoint_index, role_name, status))
 
+        self.store.set_endpoint_expectations_bulk(updates)
         self.accept()
 
 
+# Last directory used by the export and import file dialogs, so each one
+# opens where the previous one left off instead of the working directory
+_LAST_DIR = {"export": "", "import": ""}
+
+
+def _file_dialog_options():
+    """Qt's native file dialog can hang when the app is started from the VS
+    Code terminal on Linux; use Qt's own dialog there."""
+    if sys.platform.startswith("linux") and os.environ.get("TERM_PROGRAM") == "vscode":
+        return QtWidgets.QFileDialog.DontUseNativeDialog
+    return QtWidgets.QFileDialog.Options()
+
+
+def _remember_dir(kind, path, is_dir=False):
+    _LAST_DIR[kind] = path if is_dir else os.path.dirname(path)
+
+
+class FileSaver(QtCore.QObject):
+    """Writes files on a background thread and reports back to the GUI
+    thread through queued signals, so a slow disk doesn't freeze a dialog.
+
+    Text is encoded to UTF-8 once and each file is written with a single
+    binary write, so newlines are written as-is on every platform.
+    """
+
+    saved = QtCore.Signal(list)  # paths written, in order
+    failed = QtCore.Signal(str)
+
+    def __init__(self, files, parent=None):
+        super().__init__(parent)
+        self._files = files  # [(path, str or bytes), ...]
+        # Not a daemon: a write that is under way finishes even if the app quits
+        self._thread = threading.Thread(target=self._save)
+
+    def start(self):
+        self._thread.start()
+
+    def _save(self):
+        try:
+            for path, content in self._files:
+                if isinstance(content, str):
+                    content = content.encode("utf-8")
+                with open(path, "wb") as f:
+                    f.write(content)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.saved.emit([path for path, _ in self._files])
+
+
 class ExportDialog(QtWidgets.QDialog):
     """Dialog for exporting in different formats"""
 
     def __init__(self, store, parent=None):
         super().__init__(parent)
         self.store = store
+        self._saver = None
         self.setWindowTitle("Export Specification")
         self.setModal(True)
         self.setMinimumSize(300, 150)
@@ -909,27 +996,44 @@ class ExportDialog(QtWidgets.QDialog):
         filename, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Export as AuthMatrix Format",
-            "authmatrix_spec.json",
+            os.path.join(_LAST_DIR["export"], "authmatrix_spec.json"),
             "JSON Files (*.json);;All Files (*)",
+            options=_file_dialog_options(),
         )
 
         if not filename:
             return
+        _remember_dir("export", filename)
 
         try:
             content = self.store.export_as_authmatrix()
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
-            QtWidgets.QMessageBox.information(
-                self,
-                "Export Successful",
-                f"AuthMatrix specification saved to:\n{filename}",
-            )
-            self.accept()
         except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Export Error", f"Failed to save file:\n{str(e)}"
-            )
+            self._on_export_failed(str(e))
+            return
+
+        # Write off the GUI thread; the dialog is locked until it's done
+        self.setEnabled(False)
+        self._saver = FileSaver([(filename, content)], self)
+        self._saver.saved.connect(self._on_authmatrix_saved)
+        self._saver.failed.connect(self._on_export_failed)
+        self._saver.start()
+
+    def _on_authmatrix_saved(self, paths):
+        self._saver = None
+        self.setEnabled(True)
+        QtWidgets.QMessageBox.information(
+            self,
+            "Export Successful",
+            f"AuthMatrix specification saved to:\n{paths[0]}",
+        )
+        self.accept()
+
+    def _on_export_failed(self, error):
+        self._saver = None
+        self.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self, "Export Error", f"Failed to save file:\n{error}"
+        )
 
     def _export_postman_collections(self):
         """Export as multiple Postman collections, one per role"""
@@ -952,16 +1056,23 @@ class ExportDialog(QtWidgets.QDialog):
             pass
 
 
+# Collections larger than this (in characters) are only laid out in the
+# preview on request; QPlainTextEdit stalls on multi-megabyte documents.
+_LARGE_PREVIEW_CHARS = 1 << 20
+
+
 class MultiCollectionExportDialog(QtWidgets.QDialog):
     """Dialog for viewing and saving multiple Postman collections"""
 
     def __init__(self, collections: Dict[str, str], parent=None):
         super().__init__(parent)
         self.collections = collections
+        self._saver = None
+        # Tab index -> (text edit, JSON) still waiting to be shown
+        self._pending_previews = {}
         self.setWindowTitle("Export Multiple Postman Collections")
         self.setModal(True)
         self.setMinimumSize(500, 400)
-        self._size_dialog_to_parent(0.7, 0.7)
 
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -984,7 +1095,7 @@ class MultiCollectionExportDialog(QtWidgets.QDialog):
 
             # Parse to get collection info
             try:
-                collection_data = json.loads(collection_json)
+                collection_data = _json_loads(collection_json)
                 item_count = len(collection_data.get("item", []))
                 has_auth = "auth" in collection_data
 
@@ -997,11 +1108,22 @@ class MultiCollectionExportDialog(QtWidgets.QDialog):
             except:
                 pass
 
-            # Text edit to show the JSON
+            # Text edit to show the JSON, filled in when its tab is first shown
             text_edit = QtWidgets.QPlainTextEdit()
-            text_edit.setPlainText(collection_json)
             text_edit.setReadOnly(True)
             text_edit.setFont(QtGui.QFont("Courier", 9))
+            is_large = len(collection_json) > _LARGE_PREVIEW_CHARS
+            if is_large:
+                text_edit.setPlaceholderText(
+                    "This collection is large. Click Show JSON to preview it."
+                )
+                show_btn = QtWidgets.QPushButton(
+                    f"Show JSON ({len(collection_json) / (1 << 20):.1f} MB)"
+                )
+                show_btn.clicked.connect(
+                    partial(self._show_large_preview, show_btn, text_edit, collection_json)
+                )
+                tab_layout.addWidget(show_btn)
             tab_layout.addWidget(text_edit)
 
             # Add save button for this collection
@@ -1013,7 +1135,12 @@ class MultiCollectionExportDialog(QtWidgets.QDialog):
             )
             tab_layout.addWidget(save_btn)
 
-            tabs.addTab(tab, role_name.capitalize())
+            index = tabs.addTab(tab, role_name.capitalize())
+            if not is_large:
+                self._pending_previews[index] = (text_edit, collection_json)
+
+        tabs.currentChanged.connect(self._fill_preview)
+        self._fill_preview(tabs.currentIndex())
 
         # Buttons at bottom
         button_layout = QtWidgets.QHBoxLayout()
@@ -1028,77 +1155,177 @@ class MultiCollectionExportDialog(QtWidgets.QDialog):
 
         layout.addLayout(button_layout)
 
-    def _size_dialog_to_parent(self, width_ratio=0.7, height_ratio=0.7):
-        """Size dialog relative to parent window or screen"""
-        if self.parent() and isinstance(self.parent(), QtWidgets.QWidget):
-            parent_size = self.parent().size()
-            target_width = int(parent_size.width() * width_ratio)
-            target_height = int(parent_size.height() * height_ratio)
-        else:
-            screen = QtWidgets.QApplication.primaryScreen()
-            if screen:
-                available = screen.availableGeometry()
-                target_width = int(available.width() * width_ratio)
-                target_height = int(available.height() * height_ratio)
-            else:
-                return
-
-        # Ensure we don't go below minimum size
-        current_min = self.minimumSize()
-        target_width = max(target_width, current_min.width())
-        target_height = max(target_height, current_min.height())
-
-        self.resize(target_width, target_height)
+        _size_dialog_to_parent(self, 0.7, 0.7)
 
     def _save_collection(self, role_name: str, collection_json: str):
         """Save a single collection to a file"""
         filename, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
             f"Save {role_name.capitalize()} Collection",
-            f"{role_name}.postman_collection.json",
+            os.path.join(_LAST_DIR["export"], f"{role_name}.postman_collection.json"),
             "JSON Files (*.json);;All Files (*)",
+            options=_file_dialog_options(),
         )
 
         if filename:
-            try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(collection_json)
-                QtWidgets.QMessageBox.information(
-                    self, "Success", f"Collection saved to {filename}"
-                )
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(
-                    self, "Error", f"Failed to save collection: {str(e)}"
-                )
+            _remember_dir("export", filename)
+            self._start_saving(
+                [(filename, collection_json)],
+                self._on_collection_saved,
+                self._on_collection_save_failed,
+            )
+
+    def _on_collection_saved(self, paths):
+        self._saver = None
+        self.setEnabled(True)
+        QtWidgets.QMessageBox.information(
+            self, "Success", f"Collection saved to {paths[0]}"
+        )
+
+    def _on_collection_save_failed(self, error):
+        self._saver = None
+        self.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self, "Error", f"Failed to save collection: {error}"
+        )
+
+    def _fill_preview(self, index):
+        """Load a tab's JSON into its text edit the first time it's shown"""
+        pending = self._pending_previews.pop(index, None)
+        if pending is not None:
+            text_edit, collection_json = pending
+            text_edit.setPlainText(collection_json)
+
+    def _show_large_preview(self, show_btn, text_edit, collection_json):
+        """Lay out a large collection's JSON once the user asks for it"""
+        show_btn.hide()
+        text_edit.setPlainText(collection_json)
 
     def _save_all_collections(self):
         """Save all collections to a directory"""
         directory = QtWidgets.QFileDialog.getExistingDirectory(
-            self, "Select Directory to Save All Collections"
+            self,
+            "Select Directory to Save All Collections",
+            _LAST_DIR["export"],
+            QtWidgets.QFileDialog.ShowDirsOnly | _file_dialog_options(),
         )
 
         if directory:
-            try:
-                saved_files = []
-                for role_name, collection_json in self.collections.items():
-                    filename = os.path.join(
-                        directory, f"{role_name}.postman_collection.json"
-                    )
-                    with open(filename, "w", encoding="utf-8") as f:
-                        f.write(collection_json)
-                    saved_files.append(filename)
+            _remember_dir("export", directory, is_dir=True)
+            files = [
+                (os.path.join(directory, f"{role_name}.postman_collection.json"), collection_json)
+                for role_name, collection_json in self.collections.items()
+            ]
+            self._start_saving(
+                files, self._on_all_collections_saved, self._on_all_collections_save_failed
+            )
 
-                file_list = "\n".join([f"- {os.path.basename(f)}" for f in saved_files])
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Export Successful",
-                    f"Saved {len(saved_files)} Postman collection(s) to:\n{directory}\n\nFiles:\n{file_list}",
-                )
-                self.accept()
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(
-                    self, "Export Error", f"Failed to save collections:\n{str(e)}"
-                )
+    def _on_all_collections_saved(self, paths):
+        self._saver = None
+        self.setEnabled(True)
+        directory = os.path.dirname(paths[0])
+        file_list = "\n".join([f"- {os.path.basename(f)}" for f in paths])
+        QtWidgets.QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Saved {len(paths)} Postman collection(s) to:\n{directory}\n\nFiles:\n{file_list}",
+        )
+        self.accept()
+
+    def _on_all_collections_save_failed(self, error):
+        self._saver = None
+        self.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self, "Export Error", f"Failed to save collections:\n{error}"
+        )
+
+    def _start_saving(self, files, on_saved, on_failed):
+        """Write files off the GUI thread; the dialog is locked until it's done"""
+        self.setEnabled(False)
+        self._saver = FileSaver(files, self)
+        self._saver.saved.connect(on_saved)
+        self._saver.failed.connect(on_failed)
+        self._saver.start()
+
+
+# One request found while importing a Postman collection
+_CollectionEndpoint = namedtuple("_CollectionEndpoint", "name method path folder")
+
+# What the import keeps of a parsed collection; cached per file content
+_CollectionSummary = namedtuple(
+    "_CollectionSummary", "collection_name endpoints auth_config base_url"
+)
+
+# Collection-name keywords in the order they win, and the role each suggests
+_ROLE_KEYWORDS = (
+    ("admin", "admin"),
+    ("user", "user"),
+    ("guest", "guest"),
+    ("public", "guest"),
+    ("moderator", "moderator"),
+    ("mod", "moderator"),
+)
+_ROLE_KEYWORD_RE = re.compile("|".join(k for k, _ in _ROLE_KEYWORDS), re.IGNORECASE)
+
+# Optional "scheme://authority" (or "//authority") prefix, then the path up
+# to any query or fragment
+_URL_PATH_RE = re.compile(r"^(?:(?:[a-zA-Z][a-zA-Z0-9+\-.]*:)?//[^/?#]*)?([^?#]*)")
+
+
+@lru_cache(maxsize=4096)
+def _url_path(url_string: str) -> str:
+    """Path part of a URL string, or "/" when it has none"""
+    return _URL_PATH_RE.match(url_string).group(1) or "/"
+
+
+def _file_digest(file_path, chunk_size=1 << 20) -> bytes:
+    """Content hash of a file, read in chunks so big files aren't held whole"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _path_role_masks(imported_collections):
+    """Give each role a bit and OR the bits of every role that has a path.
+
+    Returns ({role: bit}, {path: role bitmask}); paths keep first-seen order.
+    """
+    role_bits = {role_name: 1 << i for i, role_name in enumerate(imported_collections)}
+    path_mask = {}
+    get = path_mask.get
+    for role_name, data in imported_collections.items():
+        bit = role_bits[role_name]
+        for endpoint in data["endpoints"]:
+            path = endpoint.path
+            path_mask[path] = get(path, 0) | bit
+    return role_bits, path_mask
+
+
+class CollectionFileLoader(QtCore.QObject):
+    """Runs a collection file parser on a background thread and hands the
+    result back to the GUI thread through queued signals."""
+
+    loaded = QtCore.Signal(object, str)  # collection_data, file_path
+    failed = QtCore.Signal(str)
+
+    def __init__(self, file_path, parse, parent=None):
+        super().__init__(parent)
+        self._file_path = file_path
+        self._parse = parse
+        self._thread = threading.Thread(target=self._load, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _load(self):
+        try:
+            collection_data = self._parse(self._file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(collection_data, self._file_path)
 
 
 class ImportDialog(QtWidgets.QDialog):
@@ -1109,7 +1336,7 @@ class ImportDialog(QtWidgets.QDialog):
         self.store = store
         self.setWindowTitle("Import API Specification")
         self.setModal(True)
-        self.setMinimumSize(500, 400)
+        self.setMinimumSize(400, 250)
         
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -1184,35 +1411,24 @@ class ImportDialog(QtWidgets.QDialog):
 
         # Store for multi-collection import
         self.imported_collections = {}
+        # {(method, path): roles that have it} and the first endpoint seen for
+        # each key, kept up to date as collections are added
+        self._merged_endpoints = defaultdict(set)
+        self._endpoint_meta = {}
+        # Inputs the analysis text was last rendered from
+        self._analysis_sig = None
+        # Background reader for the collection file being added, if any
+        self._collection_loader = None
+        # Role/auth prompt shown for each added collection, created on first use
+        self._role_dialog = None
+        # {content digest: _CollectionSummary} so re-adding the same file or
+        # text skips parsing it again
+        self._parse_cache = {}
         
         # Size and center the dialog
-        self._size_dialog_to_parent(0.7, 0.7)
+        _size_dialog_to_parent(self, 0.7, 0.7)
         self._center_on_parent()
 
-    def _size_dialog_to_parent(self, width_ratio=0.7, height_ratio=0.7):
-        """Size dialog relative to parent window or screen"""
-        if self.parent() and isinstance(self.parent(), QtWidgets.QWidget):
-            parent_size = self.parent().size()
-            target_width = int(parent_size.width() * width_ratio)
-            target_height = int(parent_size.height() * height_ratio)
-        else:
-            screen = QtWidgets.QApplication.primaryScreen()
-            if screen:
-                available = screen.availableGeometry()
-                target_width = int(available.width() * width_ratio)
-                target_height = int(available.height() * height_ratio)
-            else:
-                return
-
-
-        # Ensure we don't go below minimum size
-        current_min = self.minimumSize()
-        target_width = max(target_width, current_min.width())
-        target_height = max(target_height, current_min.height())
-
-
-        self.resize(target_width, target_height)
-
     def _center_on_parent(self):
         """Center the dialog on parent window"""
         if self.parent() and isinstance(self.parent(), QtWidgets.QWidget):
@@ -1312,9 +1528,9 @@ class ImportDialog(QtWidgets.QDialog):
         # Add collection buttons
         btn_layout = QtWidgets.QHBoxLayout()
 
-        add_file_btn = QtWidgets.QPushButton("Add Collection File")
-        add_file_btn.clicked.connect(self._add_collection_file)
-        btn_layout.addWidget(add_file_btn)
+        self.add_file_btn = QtWidgets.QPushButton("Add Collection File")
+        self.add_file_btn.clicked.connect(self._add_collection_file)
+        btn_layout.addWidget(self.add_file_btn)
 
         add_text_btn = QtWidgets.QPushButton("Add Collection Text")
         add_text_btn.clicked.connect(self._add_collection_text)
@@ -1348,24 +1564,59 @@ class ImportDialog(QtWidgets.QDialog):
     def _add_collection_file(self):
         """Add a collection from file"""
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Import Postman Collection", "", "JSON Files (*.json);;All Files (*)"
+            self,
+            "Import Postman Collection",
+            _LAST_DIR["import"],
+            "JSON Files (*.json);;All Files (*)",
+            options=_file_dialog_options(),
         )
 
         if not file_path:
             return
+        _remember_dir("import", file_path)
 
+        # Read and parse off the GUI thread so big files don't freeze the
+        # dialog; one file at a time, the role prompt follows each load
+        self.add_file_btn.setEnabled(False)
+        self._collection_loader = CollectionFileLoader(
+            file_path, self._read_collection_file
+        )
+        self._collection_loader.loaded.connect(self._on_collection_file_loaded)
+        self._collection_loader.failed.connect(self._on_collection_file_failed)
+        self._collection_loader.start()
+
+    def _read_collection_file(self, file_path):
+        """Hash, then parse and summarize a collection file unless the same
+        content was imported before; runs on the loader thread, no Qt calls"""
+        digest = _file_digest(file_path)
+        summary = self._parse_cache.get(digest)
+        if summary is None:
+            with open(file_path, "rb") as f:
+                if ijson is not None:
+                    # Stream the file, keeping only the fields the import uses
+                    collection_data = self._parse_postman_collection_stream(f)
+                else:
+                    # Parse the raw bytes; no intermediate str copy of the file
+                    collection_data = _json_loads(f.read())
+            summary = self._summarize_collection(collection_data)
+        return digest, summary
+
+    def _on_collection_file_loaded(self, result, file_path):
+        self._collection_loader = None
+        self.add_file_btn.setEnabled(True)
+        digest, summary = result
+        self._parse_cache[digest] = summary
         try:
-            import json
-
-            with open(file_path, "r", encoding="utf-8") as f:
-                collection_data = json.load(f)
-
-            self._process_collection_data(collection_data, file_path)
-
+            self._process_collection_data(summary, file_path)
         except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Import Error", f"Failed to load collection file:\n{str(e)}"
-            )
+            self._on_collection_file_failed(str(e))
+
+    def _on_collection_file_failed(self, error):
+        self._collection_loader = None
+        self.add_file_btn.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self, "Import Error", f"Failed to load collection file:\n{error}"
+        )
 
     def _add_collection_text(self):
         """Add a collection from pasted text"""
@@ -1376,12 +1627,20 @@ class ImportDialog(QtWidgets.QDialog):
             return
 
         try:
-            import json
-
-            collection_data = json.loads(text)
-            self._process_collection_data(collection_data, "pasted_content")
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            summary = self._parse_cache.get(digest)
+            if summary is None:
+                if ijson is not None:
+                    # Only build the fields the import reads, not the whole tree
+                    collection_data = self._parse_postman_collection_stream(text)
+                else:
+                    collection_data = _json_loads(text)
+                summary = self._parse_cache[digest] = self._summarize_collection(
+                    collection_data
+                )
+            self._process_collection_data(summary, "pasted_content")
 
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             QtWidgets.QMessageBox.critical(
                 self, "Import Error", f"Invalid JSON format:\n{str(e)}"
             )
@@ -1390,15 +1649,22 @@ class ImportDialog(QtWidgets.QDialog):
                 self, "Import Error", f"Failed to process collection:\n{str(e)}"
             )
 
-    def _process_collection_data(self, collection_data, source_path):
-        """Process and add a collection to the import list"""
-        # Extract collection info
+    def _summarize_collection(self, collection_data):
+        """Extract the name, endpoints, auth config and base URL of a collection"""
         collection_name = collection_data.get("info", {}).get(
             "name", "Unknown Collection"
         )
-
-        # Parse collection first to get auth config
         endpoints, auth_config = self._parse_postman_collection(collection_data)
+        return _CollectionSummary(
+            collection_name,
+            endpoints,
+            auth_config,
+            self.store.extract_base_url_from_postman(collection_data),
+        )
+
+    def _process_collection_data(self, summary, source_path):
+        """Prompt for a role and add a summarized collection to the import list"""
+        collection_name, endpoints, auth_config, base_url = summary
 
         if not endpoints:
             QtWidgets.QMessageBox.warning(
@@ -1408,43 +1674,66 @@ class ImportDialog(QtWidgets.QDialog):
             )
             return
 
-        # Let user specify the role name and modify auth config
-        dialog = RoleAuthConfigDialog(
-            self, collection_name, self._suggest_role_name(collection_name), auth_config
-        )
+        # Let user specify the role name and modify auth config; the dialog
+        # is built once and refilled for each further collection
+        suggested_role_name = self._suggest_role_name(collection_name)
+        if self._role_dialog is None:
+            self._role_dialog = RoleAuthConfigDialog(
+                self, collection_name, suggested_role_name, auth_config
+            )
+        else:
+            self._role_dialog.reset(collection_name, suggested_role_name, auth_config)
+        dialog = self._role_dialog
 
         if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
 
         role_name, updated_auth_config = dialog.get_config()
 
-        # Store collection data
+        # Store collection data; the parsed file itself is not kept
+        replacing = role_name in self.imported_collections
         self.imported_collections[role_name] = {
             "collection_name": collection_name,
             "source_path": source_path,
             "endpoints": endpoints,
             "auth_config": updated_auth_config,
-            "collection_data": collection_data,
+            "base_url": base_url,
         }
 
+        if replacing:
+            # The old collection's endpoints have to come back out
+            self._rebuild_endpoint_index()
+        else:
+            self._index_endpoints(role_name, endpoints)
+
         # Update UI
         self._update_collections_display()
 
+    def _index_endpoints(self, role_name, endpoints):
+        """Record which roles have each (method, path) as collections are added"""
+        merged = self._merged_endpoints
+        meta = self._endpoint_meta
+        for endpoint in endpoints:
+            key = (endpoint.method, endpoint.path)
+            merged[key].add(role_name)
+            meta.setdefault(key, endpoint)
+
+    def _rebuild_endpoint_index(self):
+        """Re-index every imported collection, in import order"""
+        self._merged_endpoints.clear()
+        self._endpoint_meta.clear()
+        for role_name, data in self.imported_collections.items():
+            self._index_endpoints(role_name, data["endpoints"])
+
     def _suggest_role_name(self, collection_name):
         """Suggest a role name based on collection name"""
-        name_lower = collection_name.lower()
-        if "admin" in name_lower:
-            return "admin"
-        elif "user" in name_lower:
-            return "user"
-        elif "guest" in name_lower or "public" in name_lower:
-            return "guest"
-        elif "moderator" in name_lower or "mod" in name_lower:
-            return "moderator"
-        else:
-            # Use first word or full name
-            words = collection_name.split()
-            return words[0].lower() if words else "role"
+        found = {m.group(0).lower() for m in _ROLE_KEYWORD_RE.finditer(collection_name)}
+        for keyword, role in _ROLE_KEYWORDS:
+            if keyword in found:
+                return role
+        # Use first word or full name
+        words = collection_name.split(None, 1)
+        return words[0].lower() if words else "role"
 
     def _parse_postman_collection(self, collection_data):
         """Parse Postman collection to extract endpoints and auth config"""
@@ -1456,8 +1745,16 @@ class ImportDialog(QtWidgets.QDialog):
         if collection_auth:
             auth_config = self._extract_auth_config(collection_auth)
 
-        # Recursively extract requests
-        def extract_requests(items, folder_path=""):
+        # Walk the folder tree depth-first with an explicit stack of
+        # (item iterator, folder path) instead of recursing, so deeply nested
+        # collections can't hit the recursion limit. A folder's iterator is
+        # resumed after its subfolder is done, keeping the collection's order.
+        stack = []
+        if "item" in collection_data:
+            stack.append((iter(collection_data["item"]), ""))
+
+        while stack:
+            items, folder_path = stack[-1]
             for item in items:
                 if "request" in item:
                     # This is a request
@@ -1484,13 +1781,19 @@ class ImportDialog(QtWidgets.QDialog):
                     if not path.startswith("/"):
                         path = "/" + path
 
+                    # The same few methods and paths repeat across role
+                    # collections; share one string per value for the merge
+                    path = sys.intern(path)
+                    if isinstance(method, str):
+                        method = sys.intern(method)
+
                     endpoints.append(
-                        {
-                            "name": item.get("name", f"{method} {path}"),
-                            "method": method,
-                            "path": path,
-                            "folder": folder_path,
-                        }
+                        _CollectionEndpoint(
+                            item.get("name", f"{method} {path}"),
+                            method,
+                            path,
+                            folder_path,
+                        )
                     )
 
                 elif "item" in item:
@@ -1499,27 +1802,106 @@ class ImportDialog(QtWidgets.QDialog):
                     new_folder_path = (
                         f"{folder_path}/{folder_name}" if folder_path else folder_name
                     )
-                    extract_requests(item["item"], new_folder_path)
-
-        # Extract from collection items
-        if "item" in collection_data:
-            extract_requests(collection_data["item"])
+                    stack.append((iter(item["item"]), new_folder_path))
+                    break
+            else:
+                stack.pop()
 
         return endpoints, auth_config
 
+    # What to do with each key of a streamed collection, item and request:
+    # "keep" builds the value, "items"/"request" descend into it, and any
+    # other key (bodies, events, responses, descriptions) is parsed past
+    _STREAM_COLLECTION_KEYS = {"info": "keep", "auth": "keep", "item": "items"}
+    _STREAM_ITEM_KEYS = {"name": "keep", "request": "request", "item": "items"}
+    _STREAM_REQUEST_KEYS = {"method": "keep", "url": "keep"}
+
+    def _parse_postman_collection_stream(self, source):
+        """Stream a Postman collection (binary file or JSON text) into a slim dict
+
+        Returns the same shape _parse_postman_collection and the base URL
+        lookup expect (info, auth, nested item lists with name and
+        request.method/url), so peak memory follows the slim tree rather
+        than the size of the file. The walk follows the Postman layout with
+        a stack, so no event prefixes have to be built or compared.
+        """
+        root = {}
+        # (key actions, slim dict) per map being walked; (None, list) for an
+        # item array
+        stack = [(self._STREAM_COLLECTION_KEYS, root)]
+        key = action = None  # the key whose value starts with the next event
+        skip = 0  # nesting depth inside a value being parsed past
+        builder = None
+        depth = 0
+
+        for event, value in ijson.basic_parse(source, use_float=True):
+            if skip:
+                if event in ("start_map", "start_array"):
+                    skip += 1
+                elif event in ("end_map", "end_array"):
+                    skip -= 1
+                continue
+
+            if builder is not None:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                if depth == 0:
+                    stack[-1][1][key] = builder.value
+                    builder = None
+                continue
+
+            keys, node = stack[-1]
+
+            if action is not None:
+                act, action = action, None
+                opens = event in ("start_map", "start_array")
+                if act == "items" and event == "start_array":
+                    stack.append((None, node[key]))
+                elif act == "request" and event == "start_map":
+                    request = node[key] = {}
+                    stack.append((self._STREAM_REQUEST_KEYS, request))
+                elif act in ("keep", "request"):
+                    if opens:
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        depth = 1
+                    else:
+                        node[key] = value
+                elif opens:
+                    skip = 1
+                continue
+
+            if keys is None:
+                # In an item array: every map is an item or folder
+                if event == "start_map":
+                    child = {}
+                    node.append(child)
+                    stack.append((self._STREAM_ITEM_KEYS, child))
+                elif event == "end_array":
+                    stack.pop()
+                elif event == "start_array":
+                    skip = 1
+            elif event == "map_key":
+                key = value
+                action = keys.get(value, "skip")
+                if action == "items":
+                    node[value] = []
+            elif event == "end_map":
+                stack.pop()
+            elif event == "start_array":
+                # Top-level array: not a collection, nothing to keep
+                skip = 1
+
+        return root
+
     def _extract_path_from_url(self, url_string):
         """Extract path from a URL string"""
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url_string)
-            path = parsed.path or "/"
-            # Remove query parameters
-            if "?" in path:
-                path = path.split("?")[0]
-            return path
-        except:
+        if not isinstance(url_string, str):
             return "/"
+        return _url_path(url_string)
 
     def _extract_auth_config(self, auth_data):
         """Extract authentication configuration from Postman auth"""
@@ -1540,34 +1922,45 @@ class ImportDialog(QtWidgets.QDialog):
 
     def _update_collections_display(self):
         """Update collections list and analysis"""
-        self.collections_list.clear()
-
-        for role_name, data in self.imported_collections.items():
-            collection_name = data["collection_name"]
-            endpoint_count = len(data["endpoints"])
-            auth_type = data["auth_config"].get("type", "none")
-
-            item_text = f"{role_name}: {collection_name} ({endpoint_count} endpoints, auth: {auth_type})"
-            self.collections_list.addItem(item_text)
+        item_texts = [
+            f"{role_name}: {data['collection_name']} "
+            f"({len(data['endpoints'])} endpoints, "
+            f"auth: {data['auth_config'].get('type', 'none')})"
+            for role_name, data in self.imported_collections.items()
+        ]
+
+        # Refill in one go and repaint once at the end
+        self.collections_list.setUpdatesEnabled(False)
+        with QtCore.QSignalBlocker(self.collections_list):
+            self.collections_list.clear()
+            self.collections_list.addItems(item_texts)
+        self.collections_list.setUpdatesEnabled(True)
 
         # Update analysis
         self._update_analysis()
 
     def _update_analysis(self):
         """Update the authorization pattern analysis"""
+        # Everything the text below depends on; skip the rebuild and the
+        # QTextEdit re-layout when the collections haven't changed
+        sig = tuple(
+            (
+                role_name,
+                data["auth_config"].get("type", "none"),
+                tuple(endpoint.path for endpoint in data["endpoints"]),
+            )
+            for role_name, data in self.imported_collections.items()
+        )
+        if sig == self._analysis_sig:
+            return
+        self._analysis_sig = sig
+
         if not self.imported_collections:
             self.analysis_text.clear()
             return
 
         # Analyze endpoint access patterns
-        endpoint_access = {}  # {endpoint_path: set(roles)}
-
-        for role_name, data in self.imported_collections.items():
-            for endpoint in data["endpoints"]:
-                path = endpoint["path"]
-                if path not in endpoint_access:
-                    endpoint_access[path] = set()
-                endpoint_access[path].add(role_name)
+        role_bits, path_mask = _path_role_masks(self.imported_collections)
 
         # Generate analysis text
         analysis_lines = []
@@ -1588,15 +1981,12 @@ class ImportDialog(QtWidgets.QDialog):
         analysis_lines.append("Access patterns that will be configured:")
 
         # Group by access pattern
-        access_patterns = {}  # {frozenset(roles): [endpoints]}
-        for endpoint, roles in endpoint_access.items():
-            role_key = frozenset(roles)
-            if role_key not in access_patterns:
-                access_patterns[role_key] = []
-            access_patterns[role_key].append(endpoint)
-
-        for roles, endpoints in access_patterns.items():
-            roles_list = sorted(list(roles))
+        access_patterns = defaultdict(list)  # {role bitmask: [endpoints]}
+        for endpoint, mask in path_mask.items():
+            access_patterns[mask].append(endpoint)
+
+        for mask, endpoints in access_patterns.items():
+            roles_list = sorted(r for r, bit in role_bits.items() if mask & bit)
             analysis_lines.append(f"  • Accessible to {', '.join(roles_list)}:")
             for endpoint in sorted(endpoints):
                 analysis_lines.append(f"    - {endpoint}")
@@ -1622,6 +2012,8 @@ class ImportDialog(QtWidgets.QDialog):
     def _clear_collections(self):
         """Clear all imported collections"""
         self.imported_collections.clear()
+        self._merged_endpoints.clear()
+        self._endpoint_meta.clear()
         self._update_collections_display()
 
     def _import_authmatrix_from_file(self):
@@ -1629,15 +2021,18 @@ class ImportDialog(QtWidgets.QDialog):
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Import AuthMatrix Specification",
-            "",
+            _LAST_DIR["import"],
             "JSON Files (*.json);;All Files (*)",
+            options=_file_dialog_options(),
         )
 
         if not file_path:
             return
+        _remember_dir("import", file_path)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            # Hand the raw bytes to the store; it parses them without decoding
+            with open(file_path, "rb") as f:
                 content = f.read()
 
             if self.store.load_spec_from_content(content):
@@ -1657,15 +2052,18 @@ class ImportDialog(QtWidgets.QDialog):
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Import Postman Collection",
-            "",
+            _LAST_DIR["import"],
             "JSON Files (*.json);;All Files (*)",
+            options=_file_dialog_options(),
         )
 
         if not file_path:
             return
+        _remember_dir("import", file_path)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            # Hand the raw bytes to the store; it parses them without decoding
+            with open(file_path, "rb") as f:
                 content = f.read()
 
             if self.store.load_spec_from_content(content):
@@ -1758,11 +2156,8 @@ class ImportDialog(QtWidgets.QDialog):
         # Merge all collections into a single AuthMatrix spec
         merged_spec = self._merge_collections_to_authmatrix()
 
-        # Load the merged spec
-        import json
-
-        spec_json = json.dumps(merged_spec)
-        if self.store.load_spec_from_content(spec_json):
+        # Load the merged spec; bytes go straight back into the parser
+        if self.store.load_spec_from_content(_json_dumps(merged_spec)):
             self.accept()
         else:
             QtWidgets.QMessageBox.critical(
@@ -1782,62 +2177,44 @@ class ImportDialog(QtWidgets.QDialog):
         # Extract base URL from first collection
         if self.imported_collections:
             first_collection = next(iter(self.imported_collections.values()))
-            merged_spec["base_url"] = self._extract_base_url_from_collection(
-                first_collection["collection_data"]
-            )
+            merged_spec["base_url"] = first_collection["base_url"]
 
         # Add roles from collections
         for role_name, data in self.imported_collections.items():
             auth_config = data["auth_config"]
             merged_spec["roles"][role_name] = {"auth": auth_config}
 
-        # Collect all unique endpoints
-        all_endpoints = {}  # {(method, path): {endpoint_data, access_roles}}
-
-        for role_name, data in self.imported_collections.items():
-            for endpoint in data["endpoints"]:
-                key = (endpoint["method"], endpoint["path"])
-                if key not in all_endpoints:
-                    all_endpoints[key] = {"endpoint": endpoint, "access_roles": set()}
-                all_endpoints[key]["access_roles"].add(role_name)
-
-        # Create endpoints with expectations
-        for (method, path), endpoint_data in all_endpoints.items():
-            endpoint = endpoint_data["endpoint"]
-            access_roles = endpoint_data["access_roles"]
-
-            # Create expectations for all roles
-            expectations = {}
-            for role_name in merged_spec["roles"]:
-                if role_name in access_roles:
-                    # This role should have access
-                    expectations[role_name] = {"status": 200}
-                else:
-                    # This role should be denied
-                    expectations[role_name] = {"status": 403}
-
-            merged_spec["endpoints"].append(
-                {
-                    "name": endpoint["name"],
-                    "method": endpoint["method"],
-                    "path": endpoint["path"],
-                    "expect": expectations,
-                }
-            )
+        # Unique endpoints were indexed as each collection was added
+        roles_by_key = self._merged_endpoints
+        first_seen = self._endpoint_meta
+
+        # Create endpoints with expectations: every role is denied unless it
+        # had the endpoint in its collection. The status dicts are shared
+        # between endpoints; the spec is only serialized, never edited here.
+        deny, allow = {"status": 403}, {"status": 200}
+        deny_all = {role_name: deny for role_name in merged_spec["roles"]}
+
+        def expectations_for(access_roles):
+            expectations = deny_all.copy()
+            for role_name in access_roles:
+                expectations[role_name] = allow
+            return expectations
+
+        merged_spec["endpoints"] = [
+            {
+                "name": first_seen[key].name,
+                "method": first_seen[key].method,
+                "path": first_seen[key].path,
+                "expect": expectations_for(access_roles),
+            }
+            for key, access_roles in roles_by_key.items()
+        ]
 
         return merged_spec
 
-    def _extract_base_url_from_collection(self, collection_data):
-        """Extract base URL from a Postman collection"""
-        # This reuses the logic from SpecStore
-        return self.store.extract_base_url_from_postman(collection_data)
-
     def _has_configured_expectations(self):
         """Check if any endpoints have configured expectations"""
-        for endpoint in self.store.spec.get("endpoints", []):
-            if endpoint.get("expect"):
-                return True
-        return False
+        return self.store.has_configured_expectations()
 
 
 class RoleAuthConfigDialog(QtWidgets.QDialog):
@@ -1853,36 +2230,30 @@ class RoleAuthConfigDialog(QtWidgets.QDialog):
         layout = QtWidgets.QVBoxLayout(self)
 
         # Info label
-        info_label = QtWidgets.QLabel(
-            f"Configure role and authentication for collection:\n'{collection_name}'"
-        )
-        info_label.setWordWrap(True)
-        info_label.setStyleSheet(
+        self.info_label = QtWidgets.QLabel()
+        self.info_label.setWordWrap(True)
+        self.info_label.setStyleSheet(
             "font-weight: bold; padding: 8px; background-color: #f0f0f0; border-radius: 4px;"
         )
-        layout.addWidget(info_label)
+        layout.addWidget(self.info_label)
 
         # Form layout
         form_layout = QtWidgets.QFormLayout()
 
         # Role name
-        self.role_name_edit = QtWidgets.QLineEdit(suggested_role_name)
+        self.role_name_edit = QtWidgets.QLineEdit()
         self.role_name_edit.setPlaceholderText("e.g., admin, user, guest")
         form_layout.addRow("Role Name:", self.role_name_edit)
 
         # Auth type
         self.auth_type_combo = QtWidgets.QComboBox()
         self.auth_type_combo.addItems(["none", "bearer"])
-        auth_type = auth_config.get("type", "none")
-        self.auth_type_combo.setCurrentText(auth_type)
         self.auth_type_combo.currentTextChanged.connect(self._on_auth_type_changed)
         form_layout.addRow("Auth Type:", self.auth_type_combo)
 
         # Token field (only shown for bearer auth)
         self.token_edit = QtWidgets.QLineEdit()
         self.token_edit.setPlaceholderText("Enter bearer token...")
-        current_token = auth_config.get("token", "")
-        self.token_edit.setText(current_token)
         self.token_label = QtWidgets.QLabel("Token:")
         form_layout.addRow(self.token_label, self.token_edit)
 
@@ -1912,6 +2283,20 @@ class RoleAuthConfigDialog(QtWidgets.QDialog):
 
         layout.addLayout(button_layout)
 
+        self.reset(collection_name, suggested_role_name, auth_config)
+
+    def reset(self, collection_name, suggested_role_name, auth_config):
+        """Refill the fields for another collection so the dialog can be reused"""
+        self.info_label.setText(
+            f"Configure role and authentication for collection:\n'{collection_name}'"
+        )
+        self.role_name_edit.setText(suggested_role_name)
+
+        # Unknown auth types fall back to the first entry ("none")
+        index = self.auth_type_combo.findText(auth_config.get("type", "none"))
+        self.auth_type_combo.setCurrentIndex(max(index, 0))
+        self.token_edit.setText(auth_config.get("token", ""))
+
         # Initial state
         self._on_auth_type_changed()
 
@@ -1973,13 +2358,6 @@ class RoleAuthConfigDialog(QtWidgets.QDialog):
 # Public entrypoint
 # ------------------------------
 def start_ui(runner: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
-    # Ensure multiprocessing works properly on Windows
-    try:
-        multiprocessing.set_start_method("spawn", force=True)
-    except RuntimeError:
-        # Already set, ignore
-        pass
-
     # CRITICAL: Set Windows AppUserModelID BEFORE creating QApplication
     # This is required for the taskbar icon to display correctly on Windows.
     # Must be called before any Qt windows are created.
@@ -1993,29 +2371,10 @@ def start_ui(runner: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
     
     # Set application icon for Windows taskbar
-    from pathlib import Path
-    icon_path = None
-    
-    # Try to find the icon file
-    icon_extensions = [".ico", ".png"]
-    for ext in icon_extensions:
-        # When running from source
-        candidate_path = Path(__file__).parent / "assets" / f"favicon{ext}"
-        if candidate_path.exists():
-            icon_path = candidate_path
-            break
-        
-        # When running from PyInstaller bundle
-        if hasattr(sys, "_MEIPASS"):
-            candidate_path = Path(sys._MEIPASS) / "UI" / "assets" / f"favicon{ext}"
-            if candidate_path.exists():
-                icon_path = candidate_path
-                break
-    
-    if icon_path:
-        app_icon = QtGui.QIcon(str(icon_path))
+    app_icon: QtGui.QIcon = _app_icon()
+    if not app_icon.isNull():
         app.setWindowIcon(app_icon)
-    
+
     mw = MainWindow(runner=runner)
     mw.show()
     app.exec()
@@ -2023,10 +2382,4 @@ def start_ui(runner: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
 
 # demo
 if __name__ == "__main__":
-    # Set multiprocessing start method for Windows compatibility
-    try:
-        multiprocessing.set_start_method("spawn", force=True)
-    except RuntimeError:
-        # Already set, ignore
-        pass
     start_ui()
@@ -1,6 +1,6 @@
 # Re-export start_ui for package-level import
 # Use lazy import to avoid importing UI.UI at package import time
-# This prevents triggering multiprocessing setup when just importing UI components
+# This keeps importing UI components from loading the main window module
 def start_ui(runner=None):
     """Start the UI application
     
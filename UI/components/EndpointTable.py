@@ -0,0 +1,151 @@
+"""
+Model/view pieces for large endpoint tables
+"""
+from PySide6 import QtCore, QtWidgets
+
+
+class EndpointTableModel(QtCore.QAbstractTableModel):
+    """
+    Read-only table model over ``store.spec["endpoints"]``.
+
+    Columns are name, method and an empty action column meant to be drawn
+    by a ButtonDelegate. The view only asks for the rows it shows, so no
+    per-row items or widgets are created up front.
+    """
+
+    HEADERS = ("Endpoint", "Method", "Configure")
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.store.specChanged.connect(self.refresh)
+
+    def _endpoints(self):
+        return self.store.spec.get("endpoints", [])
+
+    def refresh(self):
+        """Re-read the endpoint list from the store"""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._endpoints())
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        endpoints = self._endpoints()
+        if index.row() >= len(endpoints):
+            return None
+        endpoint = endpoints[index.row()]
+        column = index.column()
+        if column == 0:
+            return endpoint.get("name", "")
+        if column == 1:
+            return endpoint.get("method", "GET")
+        return ""
+
+    def headerData(self, section, orientation, role):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+
+# Keys that press a focused button, as on a real QPushButton
+_ACTIVATION_KEYS = (QtCore.Qt.Key_Space, QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter)
+
+
+class ButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints a push button in every cell of a column and emits ``clicked``
+    with the row when one is pressed, without creating a widget per row.
+    """
+
+    clicked = QtCore.Signal(int)
+
+    def __init__(self, text: str, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._pressed = None  # QPersistentModelIndex of the button held down
+        # Views only forward Space to the delegate; Return/Enter are turned
+        # into activated() instead, so watch for those on the view itself
+        if isinstance(parent, QtWidgets.QAbstractItemView):
+            parent.installEventFilter(self)
+
+    def _button_option(self, option, index):
+        button = QtWidgets.QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 2, -4, -2)
+        button.text = self._text
+        button.state = QtWidgets.QStyle.State_Enabled
+        if self._pressed is not None and self._pressed == index:
+            button.state |= QtWidgets.QStyle.State_Sunken
+        else:
+            button.state |= QtWidgets.QStyle.State_Raised
+        return button
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        style.drawControl(
+            QtWidgets.QStyle.CE_PushButton,
+            self._button_option(option, index),
+            painter,
+            widget,
+        )
+
+    def sizeHint(self, option, index):
+        width = option.fontMetrics.horizontalAdvance(self._text) + 32
+        height = option.fontMetrics.height() + 12
+        return QtCore.QSize(width, height)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.KeyPress:
+            if event.key() in _ACTIVATION_KEYS:
+                self.clicked.emit(index.row())
+                return True
+        elif event.type() == QtCore.QEvent.MouseButtonPress:
+            if event.button() == QtCore.Qt.LeftButton and self._hits_button(
+                event, option, index
+            ):
+                self._pressed = QtCore.QPersistentModelIndex(index)
+                self._repaint(option)
+                return True
+        elif event.type() == QtCore.QEvent.MouseButtonRelease:
+            pressed, self._pressed = self._pressed, None
+            if pressed is None:
+                return False
+            if pressed == index and self._hits_button(event, option, index):
+                self.clicked.emit(index.row())
+            self._repaint(option)
+            return True
+        return False
+
+    def eventFilter(self, watched, event):
+        if (
+            event.type() == QtCore.QEvent.KeyPress
+            and event.key() in _ACTIVATION_KEYS
+            and isinstance(watched, QtWidgets.QAbstractItemView)
+            and watched.state() != QtWidgets.QAbstractItemView.EditingState
+        ):
+            index = watched.currentIndex()
+            if index.isValid() and watched.itemDelegateForIndex(index) is self:
+                self.clicked.emit(index.row())
+                return True
+        return super().eventFilter(watched, event)
+
+    def _hits_button(self, event, option, index):
+        """Whether a mouse event falls on the painted button, not the cell margin"""
+        button = self._button_option(option, index)
+        return button.rect.contains(event.position().toPoint())
+
+    @staticmethod
+    def _repaint(option):
+        view = option.widget
+        if isinstance(view, QtWidgets.QAbstractItemView):
+            view.viewport().update()
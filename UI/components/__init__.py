@@ -4,5 +4,7 @@ from .LogoHeader import LogoHeader
 from .DialogUtils import multiline_input, show_text
 from .TabsComponent import TabsComponent
 from .SpinnerWidget import SpinnerWidget
+from .EndpointTable import EndpointTableModel, ButtonDelegate
 
-__all__ = ['LogoHeader', 'multiline_input', 'show_text', 'TabsComponent', 'SpinnerWidget']
+__all__ = ['LogoHeader', 'multiline_input', 'show_text', 'TabsComponent', 'SpinnerWidget',
+           'EndpointTableModel', 'ButtonDelegate']
@@ -1,5 +1,5 @@
 from PySide6 import QtWidgets, QtGui, QtCore
-from .SpecStore import SpecStore
+from .SpecStore import SpecStore, _AUTO_CONFIG_PROMPT
 from . import Theme
 
 class EndpointsSection(QtWidgets.QWidget):
@@ -152,12 +152,15 @@ class EndpointsSection(QtWidgets.QWidget):
             editBtn.setMinimumHeight(32)
             editBtn.setMinimumWidth(50)
             editBtn.setStyleSheet("QPushButton { padding: 6px 12px; }")
-            editBtn.clicked.connect(lambda _=None, row=i: self._edit_endpoint_row(row))
+            # One shared slot per action; the row travels on the button
+            editBtn.setProperty("row", i)
+            editBtn.clicked.connect(self._on_edit_clicked)
             deleteBtn = QtWidgets.QPushButton("Delete")
             deleteBtn.setMinimumHeight(32)
             deleteBtn.setMinimumWidth(60)
             deleteBtn.setStyleSheet("QPushButton { padding: 6px 12px; background-color: #d32f2f; color: white; }")
-            deleteBtn.clicked.connect(lambda _=None, row=i: self._delete_endpoint(row))
+            deleteBtn.setProperty("row", i)
+            deleteBtn.clicked.connect(self._on_delete_clicked)
             
             actionsLayout.addWidget(editBtn)
             actionsLayout.addWidget(deleteBtn)
@@ -165,6 +168,12 @@ class EndpointsSection(QtWidgets.QWidget):
             
             self.table.setCellWidget(i, 4, actionsWidget)
 
+    def _on_edit_clicked(self):
+        self._edit_endpoint_row(self.sender().property("row"))
+
+    def _on_delete_clicked(self):
+        self._delete_endpoint(self.sender().property("row"))
+
     def _delete_endpoint(self, row: int):
         """Delete an endpoint after confirmation."""
         ep = self.store.spec["endpoints"][row]
@@ -674,7 +683,10 @@ class ConfigureAllEndpointsDialog(QtWidgets.QDialog):
         auth_layout.addRow(add_role_btn)
         
         # List existing roles
-        self.roles_list = QtWidgets.QListWidget()
+        self._roles_model = QtCore.QStringListModel(self)
+        self.roles_list = QtWidgets.QListView()
+        self.roles_list.setModel(self._roles_model)
+        self.roles_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self._refresh_roles_list()
         auth_layout.addRow("Current Roles:", self.roles_list)
         
@@ -692,10 +704,18 @@ class ConfigureAllEndpointsDialog(QtWidgets.QDialog):
         instructions.setWordWrap(True)
         endpoints_layout.addWidget(instructions)
         
-        # Endpoints table
+        # Endpoints table; the Configure buttons are painted by one delegate
+        # instead of a QPushButton per row
+        # Lazy import to avoid circular dependency with the components package
+        from ..components.EndpointTable import ButtonDelegate
         self.endpoints_table = QtWidgets.QTableWidget()
         self.endpoints_table.setColumnCount(4)
         self.endpoints_table.setHorizontalHeaderLabels(["Endpoint", "Method", "Path", "Configure"])
+        # Column 3 has no items, only painted buttons; keep it from opening editors
+        self.endpoints_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.configure_delegate = ButtonDelegate("Configure", self.endpoints_table)
+        self.configure_delegate.clicked.connect(self._configure_endpoint)
+        self.endpoints_table.setItemDelegateForColumn(3, self.configure_delegate)
         self._refresh_endpoints_table()
         endpoints_layout.addWidget(self.endpoints_table)
         
@@ -725,11 +745,7 @@ class ConfigureAllEndpointsDialog(QtWidgets.QDialog):
         layout.addLayout(button_layout)
     
     def _refresh_roles_list(self):
-        self.roles_list.clear()
-        for role_name, role_config in self.store.spec.get("roles", {}).items():
-            auth_type = role_config.get("auth", {}).get("type", "none")
-            token_info = " (with token)" if auth_type == "bearer" else ""
-            self.roles_list.addItem(f"{role_name} - {auth_type}{token_info}")
+        self._roles_model.setStringList(self.store.role_labels())
     
     def _refresh_endpoints_table(self):
         endpoints = self.store.spec.get("endpoints", [])
@@ -745,26 +761,29 @@ class ConfigureAllEndpointsDialog(QtWidgets.QDialog):
         # Set fixed width for Configure button column
         self.endpoints_table.setColumnWidth(3, 120)
         
-        for i, endpoint in enumerate(endpoints):
-            # Endpoint name
-            name_item = QtWidgets.QTableWidgetItem(endpoint.get("name", ""))
-            name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.endpoints_table.setItem(i, 0, name_item)
-            
-            # Method
-            method_item = QtWidgets.QTableWidgetItem(endpoint.get("method", "GET"))
-            method_item.setFlags(method_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.endpoints_table.setItem(i, 1, method_item)
-            
-            # Path
-            path_item = QtWidgets.QTableWidgetItem(endpoint.get("path", ""))
-            path_item.setFlags(path_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.endpoints_table.setItem(i, 2, path_item)
-            
-            # Configure button
-            config_btn = QtWidgets.QPushButton("Configure")
-            config_btn.clicked.connect(lambda checked, idx=i: self._configure_endpoint(idx))
-            self.endpoints_table.setCellWidget(i, 3, config_btn)
+        # Fill every row with repaints and sorting suspended, then lay out once
+        sorting = self.endpoints_table.isSortingEnabled()
+        self.endpoints_table.setSortingEnabled(False)
+        self.endpoints_table.setUpdatesEnabled(False)
+        try:
+            for i, endpoint in enumerate(endpoints):
+                # Endpoint name
+                name_item = QtWidgets.QTableWidgetItem(endpoint.get("name", ""))
+                name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
+                self.endpoints_table.setItem(i, 0, name_item)
+                
+                # Method
+                method_item = QtWidgets.QTableWidgetItem(endpoint.get("method", "GET"))
+                method_item.setFlags(method_item.flags() & ~QtCore.Qt.ItemIsEditable)
+                self.endpoints_table.setItem(i, 1, method_item)
+                
+                # Path
+                path_item = QtWidgets.QTableWidgetItem(endpoint.get("path", ""))
+                path_item.setFlags(path_item.flags() & ~QtCore.Qt.ItemIsEditable)
+                self.endpoints_table.setItem(i, 2, path_item)
+        finally:
+            self.endpoints_table.setSortingEnabled(sorting)
+            self.endpoints_table.setUpdatesEnabled(True)
     
     def _add_role(self):
         dialog = AddRoleDialog(self)
@@ -784,13 +803,7 @@ class ConfigureAllEndpointsDialog(QtWidgets.QDialog):
     def _auto_configure(self):
         """Auto-configure common auth patterns"""
         reply = QtWidgets.QMessageBox.question(
-            self, "Auto-Configure", 
-            "This will set up common patterns:\n"
-            "• Public endpoints (/, /health, /status) → 200 for all roles\n"
-            "• Admin endpoints (/admin/*) → 403 for guest, 200 for admin\n"
-            "• User endpoints (/user/*, /profile) → 403 for guest, 200 for authenticated roles\n"
-            "• Other endpoints → 200 for admin, 403 for others\n\n"
-            "Continue?",
+            self, "Auto-Configure", _AUTO_CONFIG_PROMPT,
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
         )
         
@@ -799,37 +812,7 @@ class ConfigureAllEndpointsDialog(QtWidgets.QDialog):
     
     def _apply_auto_configuration(self):
         """Apply automatic configuration patterns"""
-        public_patterns = ["/", "/health", "/status", "/info", "/version", "/docs"]
-        admin_patterns = ["/admin"]
-        user_patterns = ["/user", "/profile", "/settings", "/account"]
-        
-        configured_count = 0
-        
-        for i, endpoint in enumerate(self.store.spec.get("endpoints", [])):
-            path = endpoint.get("path", "").lower()
-            
-            # Check patterns
-            is_public = any(path.startswith(pattern) for pattern in public_patterns)
-            is_admin = any(pattern in path for pattern in admin_patterns)
-            is_user = any(pattern in path for pattern in user_patterns)
-            
-            # Configure expectations
-            for role_name in self.store.spec.get("roles", {}):
-                if is_public:
-                    # Public endpoints - 200 for everyone
-                    status = 200
-                elif is_admin:
-                    # Admin endpoints - 403 for guest, 200 for admin
-                    status = 200 if role_name == "admin" else 403
-                elif is_user:
-                    # User endpoints - 403 for guest, 200 for authenticated
-                    status = 200 if role_name != "guest" else 403
-                else:
-                    # Default - 200 for admin, 403 for others
-                    status = 200 if role_name == "admin" else 403
-                
-                self.store.set_endpoint_expectation(i, role_name, status=status)
-                configured_count += 1
+        configured_count = self.store.apply_auto_configuration()
         
         QtWidgets.QMessageBox.information(
             self, "Auto-Configuration Complete", 
@@ -937,13 +920,14 @@ class EndpointConfigDialog(QtWidgets.QDialog):
         scroll_layout = QtWidgets.QVBoxLayout(scroll_widget)
         
         self.role_configs = {}
+        expectations = endpoint.get("expect") or {}
         for role_name in store.spec.get("roles", {}):
             group = QtWidgets.QGroupBox(f"Role: {role_name}")
             group_layout = QtWidgets.QFormLayout(group)
             
             # Status code
             status_edit = QtWidgets.QLineEdit()
-            current_expect = endpoint.get("expect", {}).get(role_name, {})
+            current_expect = expectations.get(role_name) or {}
             if "status" in current_expect:
                 status_val = current_expect["status"]
                 if isinstance(status_val, list):
@@ -1012,8 +996,6 @@ class EndpointConfigDialog(QtWidgets.QDialog):
     
     def _save_config(self):
         """Save the configuration for this endpoint"""
-        import json
-        
         for role_name, widgets in self.role_configs.items():
             status_text = widgets["status"].text().strip()
             contains_text = widgets["contains"].text().strip()
@@ -55,6 +55,9 @@ class KVRow(QtWidgets.QWidget):
         self.k.clear()
         self.v.clear()
 
+    def _on_delete_clicked(self):
+        self._remove_header(self.sender().property("key"))
+
     def _remove_header(self, key: str):
         """Delete a specific header by key"""
         reply = QtWidgets.QMessageBox.question(
@@ -107,7 +110,9 @@ class KVRow(QtWidgets.QWidget):
             deleteBtn.setStyleSheet(
                 "QPushButton { background-color: #d32f2f; color: white; padding: 6px 12px; }"
             )
-            deleteBtn.clicked.connect(lambda _=None, key=k: self._remove_header(key))
+            # One shared slot; the header key travels on the button
+            deleteBtn.setProperty("key", k)
+            deleteBtn.clicked.connect(self._on_delete_clicked)
 
             actionsLayout.addStretch()
             actionsLayout.addWidget(deleteBtn)
@@ -3,6 +3,8 @@ Modern stylesheet system for Firesand Auth Matrix
 Provides responsive, animated, and professional UI styles
 """
 
+from functools import lru_cache
+
 from .Theme import (
     bg1, bg2, topbar, fg1, fg2,
     primary, primary_dark, primary_light,
@@ -14,6 +16,8 @@ from .Theme import (
 )
 
 
+# The stylesheets only depend on Theme constants, so each is formatted once
+@lru_cache(maxsize=None)
 def get_main_stylesheet() -> str:
     """
     Get the main application stylesheet with modern design and animations.
@@ -543,6 +547,7 @@ def get_main_stylesheet() -> str:
     """
 
 
+@lru_cache(maxsize=None)
 def get_header_stylesheet() -> str:
     """Get stylesheet for the header/toolbar section."""
     return f"""
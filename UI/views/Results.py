@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from PySide6 import QtWidgets, QtCore
 
 
@@ -31,21 +31,44 @@ class ResultsSection(QtWidgets.QWidget):
         # Cache for SpinnerWidget class (lazy loaded to avoid circular import)
         self._SpinnerWidget = None
 
+        # Row/column keys of the current table so streaming updates and
+        # same-shaped re-renders can find a cell without scanning
+        self._row_keys: List[str] = []
+        self._col_keys: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._col_of: Dict[str, int] = {}
+
     def render(self, results: Dict[str, Dict[str, Dict[str, Any]]]):
+        first_ep = next(iter(results.values()), {}) if results else {}
+        row_keys = list(results) if results else []
+        col_keys = list(first_ep.keys())
+
+        # Same endpoints and roles as the last render: only touch cells whose
+        # text actually changed instead of tearing down every item and widget.
+        if row_keys and row_keys == self._row_keys and col_keys == self._col_keys:
+            for r, rmap in enumerate(results.values()):
+                for c, rid in enumerate(col_keys, start=1):
+                    self._apply_cell(r, c, rmap.get(rid, {}))
+            return
+
         # Reset model (clear removes headers, so we re-apply them below)
         self.table.clear()
         
         # Clean up any existing spinners
         self._cleanup_spinners()
 
+        self._row_keys = row_keys
+        self._col_keys = col_keys
+        self._row_of = {ep: r for r, ep in enumerate(row_keys)}
+        self._col_of = {rid: c for c, rid in enumerate(col_keys, start=1)}
+
         if not results:
             self.table.setRowCount(0)
             self.table.setColumnCount(1)
             self.table.setHorizontalHeaderLabels(["Endpoint"])
             return
 
-        first_ep = next(iter(results.values()), {})
-        role_order = list(first_ep.keys())
+        role_order = col_keys
         headers = ["Endpoint"] + role_order
 
         self.table.setColumnCount(len(headers))
@@ -65,56 +88,30 @@ class ResultsSection(QtWidgets.QWidget):
 
             # Role columns (centered)
             for c, rid in enumerate(role_order, start=1):
-                res = rmap.get(rid, {})
-                st = res.get("status", "")
-                
-                # Check if this is a pending status (hourglass emoji or "⏳")
-                if st == "⏳":
-                    # Create and show spinner widget
-                    self._set_cell_spinner(r, c)
-                else:
-                    # Show result text
-                    http = res.get("http", "")
-                    badge = "✅" if st == "PASS" else ("⏭️" if st == "SKIP" else "❌")
-                    text = f"{badge} {http}" if http else badge
-                    lat = res.get("latency_ms")
-                    if isinstance(lat, int):
-                        text += f"  {lat}ms"
-
-                    cell = QtWidgets.QTableWidgetItem(text)
-                    cell.setTextAlignment(QtCore.Qt.AlignCenter)
-                    self.table.setItem(r, c, cell)
+                self._apply_cell(r, c, rmap.get(rid, {}))
 
     def update_result(self, endpoint_name: str, role: str, result: Dict[str, Any]):
         """Update a single result in the table (for streaming results)"""
-        # Find the row for this endpoint
-        row = -1
-        for r in range(self.table.rowCount()):
-            item = self.table.item(r, 0)
-            if item and item.text() == endpoint_name:
-                row = r
-                break
-
-        if row == -1:
-            # Endpoint not found, this shouldn't happen
+        row = self._row_of.get(endpoint_name)
+        col = self._col_of.get(role)
+        if row is None or col is None:
+            # Endpoint or role not in the table, this shouldn't happen
             return
 
-        # Find the column for this role
-        col = -1
-        for c in range(1, self.table.columnCount()):
-            header = self.table.horizontalHeaderItem(c)
-            if header and header.text() == role:
-                col = c
-                break
+        self._apply_cell(row, col, result)
 
-        if col == -1:
-            # Role not found, this shouldn't happen
-            return
-
-        # Remove spinner if present
-        self._remove_cell_spinner(row, col)
+    def update_results(self, updates: List[tuple]):
+        """Apply several (endpoint_name, role, result) updates with one repaint"""
+        self.table.setUpdatesEnabled(False)
+        try:
+            for endpoint_name, role, result in updates:
+                self.update_result(endpoint_name, role, result)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-        # Update the cell with result
+    @staticmethod
+    def _cell_text(result: Dict[str, Any]) -> str:
+        """Badge, HTTP status and latency shown for a finished check"""
         st = result.get("status", "")
         http = result.get("http", "")
         badge = "✅" if st == "PASS" else ("⏭️" if st == "SKIP" else "❌")
@@ -122,10 +119,31 @@ class ResultsSection(QtWidgets.QWidget):
         lat = result.get("latency_ms")
         if isinstance(lat, int):
             text += f"  {lat}ms"
+        return text
+
+    def _apply_cell(self, row: int, col: int, result: Dict[str, Any]):
+        """Bring one role cell up to date, reusing its item and spinner"""
+        item = self.table.item(row, col)
+
+        # Check if this is a pending status (hourglass emoji or "⏳")
+        if result.get("status", "") == "⏳":
+            if (row, col) not in self._spinners:
+                self._set_cell_spinner(row, col)
+            # Don't let a previous run's result show through behind the spinner
+            if item is not None and item.text():
+                item.setText("")
+            return
+
+        if (row, col) in self._spinners:
+            self._remove_cell_spinner(row, col)
 
-        cell = QtWidgets.QTableWidgetItem(text)
-        cell.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.table.setItem(row, col, cell)
+        text = self._cell_text(result)
+        if item is None:
+            item = QtWidgets.QTableWidgetItem(text)
+            item.setTextAlignment(QtCore.Qt.AlignCenter)
+            self.table.setItem(row, col, item)
+        elif item.text() != text:
+            item.setText(text)
     
     def _set_cell_spinner(self, row: int, col: int):
         """Set a spinner widget in the specified cell"""
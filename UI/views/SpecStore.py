@@ -1,8 +1,43 @@
 from PySide6 import QtCore
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union
 import json
+import pickle
+from urllib.parse import urlparse
+
+try:
+    # Optional C JSON parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    import orjson
+    from orjson import loads as _json_loads, dumps as _json_dumps
+
+    def _json_dumps_pretty(obj) -> str:
+        """Two-space indented JSON text for exports"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Compact UTF-8 JSON, matching orjson.dumps"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _json_dumps_pretty(obj) -> str:
+        """Two-space indented JSON text for exports, matching orjson's OPT_INDENT_2"""
+        return json.dumps(obj, ensure_ascii=False, indent=2)
 
 AUTHMATRIX_SHEBANG = "#!AUTHMATRIX"
+AUTHMATRIX_SHEBANG_BYTES = AUTHMATRIX_SHEBANG.encode("ascii")
+
+# Path patterns and confirmation text for the dialogs' auto-configuration
+_PUBLIC_PATH_PREFIXES = ("/", "/health", "/status", "/info", "/version", "/docs")
+_ADMIN_PATH_MARKERS = ("/admin",)
+_USER_PATH_MARKERS = ("/user", "/profile", "/settings", "/account")
+_AUTO_CONFIG_PROMPT = (
+    "This will set up common patterns:\n"
+    "• Public endpoints (/, /health, /status) → 200 for all roles\n"
+    "• Admin endpoints (/admin/*) → 403 for guest, 200 for admin\n"
+    "• User endpoints (/user/*, /profile) → 403 for guest, 200 for authenticated roles\n"
+    "• Other endpoints → 200 for admin, 403 for others\n\n"
+    "Continue?"
+)
 
 
 class SpecStore(QtCore.QObject):
@@ -19,31 +54,45 @@ class SpecStore(QtCore.QObject):
             "endpoints": [],  # list of {name, path, method, expect: role->{"status": int|[int], "contains": [str], "not_contains": [str]}}
         }
         self._original_postman_data = None  # Store original Postman data for export
+        self._pickled_spec = None  # (spec, bytes) cached by pickled_spec()
+        # Views that edit self.spec directly emit specChanged themselves
+        self.specChanged.connect(self._invalidate_caches)
+
+    def load_spec_from_content(self, content: Union[str, bytes]) -> bool:
+        """Load spec from JSON content, auto-detecting format.
 
-    def load_spec_from_content(self, content: str) -> bool:
-        """Load spec from JSON content, auto-detecting format"""
+        File imports should pass the raw bytes so they are parsed without
+        first being decoded into a str.
+        """
         try:
-            # Check for shebang
-            lines = content.splitlines()
-            has_shebang = lines and lines[0].strip() == AUTHMATRIX_SHEBANG
+            # Check for shebang without splitting the whole document into lines
+            if isinstance(content, bytes):
+                first_line, _, rest = content.partition(b"\n")
+                has_shebang = first_line.strip() == AUTHMATRIX_SHEBANG_BYTES
+            else:
+                first_line, _, rest = content.partition("\n")
+                has_shebang = first_line.strip() == AUTHMATRIX_SHEBANG
 
             if has_shebang:
                 # AuthMatrix format - skip shebang and parse
-                json_content = "\n".join(lines[1:])
-                self.spec = json.loads(json_content)
+                self.spec = _json_loads(rest)
                 self._original_postman_data = None
             else:
                 # Try to parse as JSON
-                data = json.loads(content)
+                data = _json_loads(content)
 
                 # Check if it's a Postman collection
                 if self.is_postman_collection(data):
                     self._original_postman_data = data
                     self.spec = self.convert_postman_to_authmatrix(data)
-                else:
+                elif isinstance(data, dict) and any(
+                    key in data for key in ("base_url", "roles", "endpoints")
+                ):
                     # Assume it's AuthMatrix format without shebang
                     self.spec = data
                     self._original_postman_data = None
+                else:
+                    raise ValueError("Not an AuthMatrix spec or Postman collection")
 
             # Ensure required fields exist
             self.spec.setdefault("base_url", "")
@@ -51,7 +100,7 @@ class SpecStore(QtCore.QObject):
             self.spec.setdefault("roles", {"guest": {"auth": {"type": "none"}}})
             self.spec.setdefault("endpoints", [])
 
-            self.specChanged.emit()
+            self._notify_changed()
             return True
 
         except Exception as e:
@@ -109,8 +158,6 @@ class SpecStore(QtCore.QObject):
                 if isinstance(url_info, str):
                     # Simple string URL
                     try:
-                        from urllib.parse import urlparse
-
                         parsed = urlparse(url_info)
                         return f"{parsed.scheme}://{parsed.netloc}"
                     except:
@@ -155,8 +202,6 @@ class SpecStore(QtCore.QObject):
 
                 if isinstance(url_info, str):
                     try:
-                        from urllib.parse import urlparse
-
                         parsed = urlparse(url_info)
                         path = parsed.path or "/"
                     except:
@@ -195,22 +240,22 @@ class SpecStore(QtCore.QObject):
 
     def export_as_authmatrix(self) -> str:
         """Export current spec as AuthMatrix format with shebang"""
-        json_content = json.dumps(self.spec, indent=2)
+        json_content = _json_dumps_pretty(self.spec)
         return f"{AUTHMATRIX_SHEBANG}\n{json_content}"
 
     def export_as_postman(self) -> str:
         """Export as Postman collection format"""
         if self._original_postman_data:
             # If we have original Postman data, update it with current changes
-            return json.dumps(self._update_postman_collection(), indent=2)
+            return _json_dumps_pretty(self._update_postman_collection())
         else:
             # Convert from AuthMatrix to Postman format
-            return json.dumps(self._convert_authmatrix_to_postman(), indent=2)
+            return _json_dumps_pretty(self._convert_authmatrix_to_postman())
 
     def _update_postman_collection(self) -> dict:
         """Update original Postman collection with current auth and endpoint changes"""
         # Create a copy of the original data
-        updated_collection = json.loads(json.dumps(self._original_postman_data))
+        updated_collection = _json_loads(_json_dumps(self._original_postman_data))
 
         # Remove any auth configuration - auth is handled by AuthMatrix only
         if "auth" in updated_collection:
@@ -366,30 +411,52 @@ class SpecStore(QtCore.QObject):
 
             # Only add collection if it has at least one endpoint
             if postman_collection["item"]:
-                collections[role_name] = json.dumps(postman_collection, indent=2)
+                collections[role_name] = _json_dumps_pretty(postman_collection)
 
         return collections
 
+    def _invalidate_caches(self):
+        self._pickled_spec = None
+
+    def _notify_changed(self):
+        """Drop cached serializations and notify listeners of a spec change"""
+        self._invalidate_caches()
+        self.specChanged.emit()
+
+    def pickled_spec(self) -> bytes:
+        """Return a pickled snapshot of the spec for the run's worker thread.
+
+        The worker unpickles its own copy, so edits made while a run is in
+        progress don't change what it tests. The bytes are cached until the
+        spec changes, so re-running an unchanged spec doesn't re-serialize
+        every endpoint and role.
+        """
+        cached = self._pickled_spec
+        if cached is None or cached[0] is not self.spec:
+            cached = (self.spec, pickle.dumps(self.spec, protocol=pickle.HIGHEST_PROTOCOL))
+            self._pickled_spec = cached
+        return cached[1]
+
     # project
     def set_base_url(self, url: str):
         self.spec["base_url"] = (url or "").strip()
-        self.specChanged.emit()
+        self._notify_changed()
 
     def set_header(self, key: str, val: str):
         k = (key or "").strip()
         if not k:
             return
         self.spec["default_headers"][k] = val
-        self.specChanged.emit()
+        self._notify_changed()
 
     def remove_header(self, key: str):
         self.spec["default_headers"].pop(key, None)
-        self.specChanged.emit()
+        self._notify_changed()
 
     def remove_all_headers(self):
         """Remove all headers except the default Accept header."""
         self.spec["default_headers"] = {"Accept": "application/json"}
-        self.specChanged.emit()
+        self._notify_changed()
 
     # endpoints (bulk parse + table edits)
     def parse_endpoints_text(self, text: str) -> List[Tuple[str, str, str]]:
@@ -436,26 +503,26 @@ class SpecStore(QtCore.QObject):
         self.spec["endpoints"] = [
             {"name": n, "method": m, "path": p, "expect": {}} for (n, m, p) in rows
         ]
-        self.specChanged.emit()
+        self._notify_changed()
 
     def update_endpoint_row(self, index: int, name: str, method: str, path: str):
         if 0 <= index < len(self.spec["endpoints"]):
             self.spec["endpoints"][index].update(
                 {"name": name, "method": method, "path": path}
             )
-            self.specChanged.emit()
+            self._notify_changed()
 
     def add_endpoint(self, name: str, method: str, path: str):
         """Add a new endpoint to the list."""
         endpoint = {"name": name, "method": method, "path": path, "expect": {}}
         self.spec["endpoints"].append(endpoint)
-        self.specChanged.emit()
+        self._notify_changed()
 
     def delete_endpoint(self, index: int):
         """Delete an endpoint by index."""
         if 0 <= index < len(self.spec["endpoints"]):
             del self.spec["endpoints"][index]
-            self.specChanged.emit()
+            self._notify_changed()
 
     # roles/tokens
     def add_role(self, role: str, auth_type: str, token: str):
@@ -473,7 +540,7 @@ class SpecStore(QtCore.QObject):
         # upsert role auth
         self.spec["roles"][rid] = {"auth": auth}
 
-        self.specChanged.emit()
+        self._notify_changed()
         return True, None
 
     def remove_role(self, rid: str):
@@ -482,9 +549,13 @@ class SpecStore(QtCore.QObject):
             for ep in self.spec["endpoints"]:
                 if "expect" in ep and rid in ep["expect"]:
                     del ep["expect"][rid]
-            self.specChanged.emit()
+            self._notify_changed()
 
     # endpoint expectations
+    def has_configured_expectations(self) -> bool:
+        """Check if any endpoint has at least one expectation configured"""
+        return any(ep.get("expect") for ep in self.spec.get("endpoints", ()))
+
     def set_endpoint_expectation(
         self,
         endpoint_index: int,
@@ -511,9 +582,77 @@ class SpecStore(QtCore.QObject):
         if not_contains:
             ep["expect"][role]["not_contains"] = not_contains
 
-        self.specChanged.emit()
+        self._notify_changed()
+        return True, None
+
+    def set_endpoint_expectations_bulk(self, updates: List[Tuple[int, str, Any]]):
+        """Set status expectations for many (endpoint index, role, status)
+        triples, emitting specChanged once.
+
+        Nothing is changed if any triple is invalid.
+        """
+        endpoints = self.spec["endpoints"]
+        roles = self.spec["roles"]
+        for endpoint_index, role, _ in updates:
+            if not (0 <= endpoint_index < len(endpoints)):
+                return False, "Invalid endpoint index"
+            if role not in roles:
+                return False, f"Role '{role}' does not exist"
+
+        for endpoint_index, role, status in updates:
+            expect = endpoints[endpoint_index].setdefault("expect", {})
+            expect[role] = {} if status is None else {"status": status}
+
+        if updates:
+            self._notify_changed()
         return True, None
 
+    def apply_auto_configuration(self) -> int:
+        """Set every role's expected status on every endpoint from common
+        path patterns, emitting specChanged once.
+
+        Returns the number of (endpoint, role) expectations set.
+        """
+        roles = tuple(self.spec.get("roles", {}))
+
+        # Statuses per role depend only on the endpoint's category
+        admin_only = [(r, 200 if r == "admin" else 403) for r in roles]
+        statuses_by_category = {
+            # Public endpoints - 200 for everyone
+            "public": [(r, 200) for r in roles],
+            # Admin endpoints - 403 for guest, 200 for admin
+            "admin": admin_only,
+            # User endpoints - 403 for guest, 200 for authenticated
+            "user": [(r, 200 if r != "guest" else 403) for r in roles],
+            # Default - 200 for admin, 403 for others
+            "other": admin_only,
+        }
+
+        updates = []
+        for i, endpoint in enumerate(self.spec.get("endpoints", [])):
+            path = endpoint.get("path", "").lower()
+            if path.startswith(_PUBLIC_PATH_PREFIXES):
+                category = "public"
+            elif any(marker in path for marker in _ADMIN_PATH_MARKERS):
+                category = "admin"
+            elif any(marker in path for marker in _USER_PATH_MARKERS):
+                category = "user"
+            else:
+                category = "other"
+            updates.extend((i, role, status) for role, status in statuses_by_category[category])
+
+        self.set_endpoint_expectations_bulk(updates)
+        return len(updates)
+
+    def role_labels(self) -> List[str]:
+        """One "name - auth type" line per role for the roles lists"""
+        labels = []
+        for role_name, role_config in self.spec.get("roles", {}).items():
+            auth_type = role_config.get("auth", {}).get("type", "none")
+            token_info = " (with token)" if auth_type == "bearer" else ""
+            labels.append(f"{role_name} - {auth_type}{token_info}")
+        return labels
+
     def remove_endpoint_expectation(self, endpoint_index: int, role: str):
         """Remove expectation for a specific role on a specific endpoint."""
         if not (0 <= endpoint_index < len(self.spec["endpoints"])):
@@ -523,5 +662,5 @@ class SpecStore(QtCore.QObject):
         if "expect" in ep and role in ep["expect"]:
             del ep["expect"][role]
 
-        self.specChanged.emit()
+        self._notify_changed()
         return True, None
@@ -57,6 +57,9 @@ class TokensSection(QtWidgets.QWidget):
             return
         self.roleEdit.clear(); self.tokenEdit.clear()
 
+    def _on_delete_clicked(self):
+        self._remove_role(self.sender().property("role"))
+
     def _remove_role(self, role_name: str):
         """Delete a specific role"""
         reply = QtWidgets.QMessageBox.question(
@@ -73,13 +76,13 @@ class TokensSection(QtWidgets.QWidget):
         """Delete all roles except the default guest role"""
         roles = self.store.spec.get("roles", {})
         # Count roles that can be deleted (excluding guest)
-        deletable_roles = [role for role in roles.keys()]
+        deletable_roles = [role for role in roles.keys() if role != "guest"]
         
         if not deletable_roles:
             QtWidgets.QMessageBox.information(
                 self,
                 "No Roles to Delete",
-                "There are no roles to delete."
+                "There are no roles to delete besides the default guest role."
             )
             return
         
@@ -87,7 +90,8 @@ class TokensSection(QtWidgets.QWidget):
             self,
             "Confirm Delete All",
             f"Are you sure you want to delete all {len(deletable_roles)} role(s)?\n\n"
-            f"This will remove: {', '.join(deletable_roles)}\n\n"
+            f"This will remove: {', '.join(deletable_roles)}\n"
+            f"The guest role will be kept.\n\n"
             f"This action cannot be undone.",
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
             QtWidgets.QMessageBox.No
@@ -121,7 +125,9 @@ class TokensSection(QtWidgets.QWidget):
             deleteBtn.setMinimumHeight(32)
             deleteBtn.setMinimumWidth(60)
             deleteBtn.setStyleSheet("QPushButton { background-color: #d32f2f; color: white; padding: 6px 12px; }")
-            deleteBtn.clicked.connect(lambda _=None, role=rid: self._remove_role(role))
+            # One shared slot; the role name travels on the button
+            deleteBtn.setProperty("role", rid)
+            deleteBtn.clicked.connect(self._on_delete_clicked)
             
             actionsLayout.addStretch()
             actionsLayout.addWidget(deleteBtn)
@@ -8,8 +8,19 @@ tests that mock PySide6. UI tests will automatically enable pytest-qt
 when needed.
 """
 
+import os
 import pytest
 import sys
+import types
+
+
+# Headless Linux (CI) has no display for QApplication to connect to
+if (
+    sys.platform.startswith("linux")
+    and not os.environ.get("DISPLAY")
+    and not os.environ.get("WAYLAND_DISPLAY")
+):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 
 def pytest_configure(config):
@@ -18,30 +29,64 @@ def pytest_configure(config):
     pass
 
 
+def _is_isolated_module(name):
+    """Modules a test file may replace with mocks while it is imported"""
+    return name.split(".", 1)[0] in ("PySide6", "UI")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    """Undo a test file's import-time PySide6 mocks once it is collected.
+
+    Some test files put a mocked PySide6 into sys.modules at import time.
+    Their tests keep the objects they imported, but without this every file
+    collected after them would import the mocks instead of the real Qt.
+    """
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+
+    saved = {k: v for k, v in sys.modules.items() if _is_isolated_module(k)}
+    yield
+    names = [k for k in sys.modules if _is_isolated_module(k)]
+    if all(isinstance(sys.modules[k], types.ModuleType) for k in names):
+        return
+    # Drop the mocks and whatever was imported against them; the real
+    # extension modules that were already loaded are put back as they were
+    for name in names:
+        if sys.modules[name] is not saved.get(name):
+            del sys.modules[name]
+    sys.modules.update(saved)
+
+
 @pytest.fixture(scope='session')
-def qapp(request):
-    """Session-wide QApplication instance for UI tests"""
-    # Only create QApplication for UI tests
-    if not any(request.node.iter_markers('ui')):
-        pytest.skip("Not a UI test")
-    
+def _qapp_instance():
+    """Session-wide QApplication instance, created on first use"""
     try:
         from PySide6.QtWidgets import QApplication
         from PySide6.QtCore import Qt
-        
+    except ImportError as e:
+        pytest.skip(f"PySide6 not available: {e}")
+
+    app = QApplication.instance()
+    if app is None:
         # Set high DPI attributes before creating QApplication
         QApplication.setHighDpiScaleFactorRoundingPolicy(
             Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
         )
-        
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
-        
-        yield app
-        
-    except ImportError as e:
-        pytest.skip(f"PySide6 not available: {e}")
+        app = QApplication(sys.argv)
+
+    yield app
+
+
+@pytest.fixture
+def qapp(request):
+    """QApplication instance for UI tests"""
+    # Only hand out the QApplication to UI tests; markers are checked on the
+    # test itself, a session-scoped fixture would only see the session's
+    if not any(request.node.iter_markers('ui')):
+        pytest.skip("Not a UI test")
+    return request.getfixturevalue('_qapp_instance')
 
 
 @pytest.fixture
@@ -65,6 +110,17 @@ def qtbot(qapp):
             QTimer.singleShot(ms, loop.quit)
             loop.exec()
         
+        def waitUntil(self, callback, timeout=5000):
+            """Process events until callback() is truthy or timeout ms pass"""
+            import time
+            from PySide6.QtCore import QEventLoop
+            deadline = time.monotonic() + timeout / 1000
+            while not callback():
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"waitUntil timed out after {timeout} ms")
+                self.app.processEvents(QEventLoop.AllEvents, 10)
+                time.sleep(0.005)
+        
         def cleanup(self):
             """Clean up widgets"""
             for widget in self._widgets:
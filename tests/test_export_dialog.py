@@ -25,6 +25,8 @@ class MockSignal:
 class MockQtCore:
     QObject = object
     Signal = MockSignal
+    QAbstractTableModel = object
+    QModelIndex = MagicMock
 
 
 mock_pyside6 = MagicMock()
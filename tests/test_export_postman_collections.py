@@ -24,6 +24,8 @@ class MockSignal:
 class MockQtCore:
     QObject = object
     Signal = MockSignal
+    QAbstractTableModel = object
+    QModelIndex = MagicMock
 
 
 mock_pyside6 = MagicMock()
@@ -504,6 +506,12 @@ class TestExportPostmanCollectionsEdgeCases:
         user_collection = json.loads(collections["user"])
 
         assert user_collection["item"][0]["name"] == "获取用户信息"
+        # Non-ASCII text is written as is rather than as \u escapes, and the
+        # file's UTF-8 bytes load back to the same collection
+        assert "获取用户信息" in collections["user"]
+        assert "\\u" not in collections["user"]
+        encoded = collections["user"].encode("utf-8")
+        assert json.loads(encoded.decode("utf-8")) == user_collection
 
     def test_export_with_missing_base_url(self):
         """Test export when base_url is missing or empty"""
@@ -182,6 +182,148 @@ class TestImportDialogFileImport:
         assert len(store.spec.get('endpoints', [])) > 0
 
 
+    def test_streamed_collection_parses_like_full_load(self, qtbot):
+        """Test the streaming parser keeps what the import needs and drops the rest"""
+        import io
+        import json
+        pytest.importorskip("ijson")
+
+        store = SpecStore()
+        dialog = ImportDialog(store)
+        qtbot.addWidget(dialog)
+
+        collection = {
+            "info": {"name": "Streamed"},
+            "auth": {"type": "bearer", "bearer": [{"key": "token", "value": "abc"}]},
+            "item": [
+                {"name": "Create", "request": {
+                    "method": "POST",
+                    "url": {"protocol": "https", "host": ["api", "test"], "path": ["users"]},
+                    "body": {"mode": "raw", "raw": "{}"},
+                }, "response": [{"body": "ignored"}]},
+                {"name": "Admin", "item": [
+                    {"name": "Stats", "request": {"method": "GET", "url": "https://api.test/admin/stats"}},
+                ]},
+            ],
+        }
+
+        slim = dialog._parse_postman_collection_stream(io.BytesIO(json.dumps(collection).encode()))
+
+        assert dialog._parse_postman_collection(slim) == dialog._parse_postman_collection(collection)
+        assert store.extract_base_url_from_postman(slim) == "https://api.test"
+        assert "body" not in slim["item"][0]["request"]
+        assert "response" not in slim["item"][0]
+
+
+    def test_extract_path_from_url(self, qtbot):
+        """Test path extraction drops scheme, host, query and fragment"""
+        dialog = ImportDialog(SpecStore())
+        qtbot.addWidget(dialog)
+
+        assert dialog._extract_path_from_url("https://api.test:8443/v1/users?page=2#top") == "/v1/users"
+        assert dialog._extract_path_from_url("//cdn.test/assets") == "/assets"
+        assert dialog._extract_path_from_url("{{baseUrl}}/users?x=1") == "{{baseUrl}}/users"
+        assert dialog._extract_path_from_url("https://api.test") == "/"
+        assert dialog._extract_path_from_url("") == "/"
+
+
+    def test_suggest_role_name(self, qtbot):
+        """Test role suggestions follow keyword priority and fall back to the first word"""
+        dialog = ImportDialog(SpecStore())
+        qtbot.addWidget(dialog)
+
+        assert dialog._suggest_role_name("User Admin API") == "admin"
+        assert dialog._suggest_role_name("SuperUser endpoints") == "user"
+        assert dialog._suggest_role_name("PUBLIC api") == "guest"
+        assert dialog._suggest_role_name("Moderation tools") == "moderator"
+        assert dialog._suggest_role_name("Billing Service") == "billing"
+        assert dialog._suggest_role_name("") == "role"
+
+
+    def test_add_collection_file_loads_in_background(self, qtbot, tmp_path):
+        """Test collection files are parsed off the GUI thread, then added"""
+        store = SpecStore()
+        dialog = ImportDialog(store)
+        qtbot.addWidget(dialog)
+
+        test_file = tmp_path / "admin_collection.json"
+        test_file.write_text(
+            '{"info": {"name": "Admin API"}, "item": [{"name": "Stats", '
+            '"request": {"method": "GET", "url": "https://api.test/admin/stats"}}]}'
+        )
+
+        with patch('PySide6.QtWidgets.QFileDialog.getOpenFileName', return_value=(str(test_file), '')):
+            with patch('UI.UI.RoleAuthConfigDialog') as mock_role:
+                mock_role.return_value.exec.return_value = QtWidgets.QDialog.Accepted
+                mock_role.return_value.get_config.return_value = ("admin", {"type": "none"})
+                dialog._add_collection_file()
+
+                # Button stays disabled until the loader reports back
+                assert not dialog.add_file_btn.isEnabled()
+                qtbot.waitUntil(lambda: dialog._collection_loader is None)
+
+        assert dialog.add_file_btn.isEnabled()
+        assert dialog.imported_collections["admin"]["base_url"] == "https://api.test"
+        assert dialog.imported_collections["admin"]["endpoints"][0].path == "/admin/stats"
+
+
+    def test_role_dialog_reset_refills_fields(self, qtbot):
+        """Test the reused role/auth dialog shows the new collection's values"""
+        from UI.UI import RoleAuthConfigDialog
+
+        role_dialog = RoleAuthConfigDialog(None, "Admin API", "admin", {"type": "bearer", "token": "t1"})
+        qtbot.addWidget(role_dialog)
+        assert role_dialog.get_config() == ("admin", {"type": "bearer", "token": "t1"})
+
+        role_dialog.reset("Public API", "guest", {"type": "none"})
+
+        assert "Public API" in role_dialog.info_label.text()
+        assert role_dialog.token_edit.text() == ""
+        assert role_dialog.get_config() == ("guest", {"type": "none"})
+
+
+    def test_parse_deeply_nested_collection(self, qtbot):
+        """Test folder nesting deeper than the recursion limit still parses"""
+        import sys
+
+        dialog = ImportDialog(SpecStore())
+        qtbot.addWidget(dialog)
+
+        collection = {"item": [{"name": "Leaf", "request": {"method": "GET", "url": "https://api.test/leaf"}}]}
+        depth = sys.getrecursionlimit() + 100
+        for _ in range(depth):
+            collection = {"item": [{"name": "f", "item": collection["item"]}]}
+
+        endpoints, _ = dialog._parse_postman_collection(collection)
+
+        assert len(endpoints) == 1
+        assert endpoints[0].path == "/leaf"
+        assert endpoints[0].folder.count("/") == depth - 1
+
+
+    def test_same_collection_is_parsed_once(self, qtbot):
+        """Test re-adding identical collection content reuses the first parse"""
+        dialog = ImportDialog(SpecStore())
+        qtbot.addWidget(dialog)
+
+        text = (
+            '{"info": {"name": "Admin API"}, "item": [{"name": "Stats", '
+            '"request": {"method": "GET", "url": "https://api.test/admin/stats"}}]}'
+        )
+
+        with patch.object(dialog, '_parse_postman_collection', wraps=dialog._parse_postman_collection) as parse:
+            for role in ("admin", "admin_v2"):
+                with patch('UI.UI.multiline_input', return_value=(text, True)):
+                    with patch.object(dialog, '_role_dialog') as role_dialog:
+                        role_dialog.exec.return_value = QtWidgets.QDialog.Accepted
+                        role_dialog.get_config.return_value = (role, {"type": "none"})
+                        dialog._add_collection_text()
+
+        assert parse.call_count == 1
+        assert set(dialog.imported_collections) == {"admin", "admin_v2"}
+        assert dialog.imported_collections["admin_v2"]["base_url"] == "https://api.test"
+
+
 @pytest.mark.ui
 class TestImportDialogWarningMessages:
     """Test updated warning messages"""
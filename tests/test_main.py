@@ -408,6 +408,38 @@ class TestRequestExtraction:
         assert len(result) == 1
         assert result[0]["path"] == "/"
 
+    def test_extract_requests_preserves_folder_order(self):
+        """Test nested folders are walked depth-first in document order"""
+        postman_data = {
+            "item": [
+                {"name": "A", "request": {"method": "GET", "url": "https://x.com/a"}},
+                {"name": "Folder", "item": [
+                    {"name": "B", "request": {"method": "GET", "url": "https://x.com/b"}},
+                    {"name": "Sub", "item": [
+                        {"name": "C", "request": {"method": "GET", "url": "https://x.com/c"}}
+                    ]},
+                    {"name": "D", "request": {"method": "GET", "url": "https://x.com/d"}}
+                ]},
+                {"name": "E", "request": {"method": "GET", "url": "https://x.com/e"}}
+            ]
+        }
+        result = extract_requests_from_postman(postman_data)
+        assert [r["name"] for r in result] == ["A", "B", "C", "D", "E"]
+    
+    def test_extract_requests_deeply_nested(self):
+        """Test very deep folder nesting does not hit the recursion limit"""
+        postman_data = {"item": []}
+        current = postman_data
+        for _ in range(sys.getrecursionlimit() + 100):
+            folder = {"name": "f", "item": []}
+            current["item"].append(folder)
+            current = folder
+        current["item"].append({"name": "Deep", "request": {"method": "GET", "url": "https://x.com/deep"}})
+        
+        result = extract_requests_from_postman(postman_data)
+        assert len(result) == 1
+        assert result[0]["path"] == "/deep"
+
 
 class TestSpecLoading:
     """Test specification loading functionality"""
@@ -581,10 +613,110 @@ class TestSpecLoadingEdgeCases:
             os.unlink(temp_file)
 
 
+    def test_load_spec_streamed_postman_matches_full_parse(self):
+        """Test the ijson streaming path produces the same spec as a full parse"""
+        pytest.importorskip("ijson")
+        import Firesand_Auth_Matrix
+        
+        postman_content = {
+            "info": {"name": "Stream Test"},
+            "auth": {"type": "bearer", "bearer": [{"key": "token", "value": "abc"}]},
+            "item": [
+                {
+                    "name": "Folder",
+                    "item": [
+                        {"name": "Nested", "request": {"method": "POST", "url": {
+                            "protocol": "https", "host": ["api", "example", "com"],
+                            "port": "8443", "path": ["v1", "nested"]}}}
+                    ]
+                },
+                {"name": "Top", "request": {"method": "GET", "url": "https://other.example.com/top"}}
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            json.dump(postman_content, f)
+            temp_file = f.name
+        
+        try:
+            with open(temp_file, "rb") as f:
+                streamed = Firesand_Auth_Matrix._stream_postman(f)
+            assert streamed == convert_postman_to_authmatrix(postman_content)
+            assert load_and_convert_spec(temp_file) == streamed
+        finally:
+            os.unlink(temp_file)
+
+
+    def test_stream_postman_reads_file_once(self):
+        """Test auth after the items is still found, in a single read of the file"""
+        pytest.importorskip("ijson")
+        import io
+        import Firesand_Auth_Matrix
+        
+        postman_content = {
+            "info": {"name": "Stream Test"},
+            "item": [
+                {"name": "Top", "request": {"method": "GET", "url": "https://api.example.com/top"}}
+            ],
+            "auth": {"type": "bearer", "bearer": [{"key": "token", "value": "abc"}]},
+        }
+        data = json.dumps(postman_content).encode("utf-8")
+        
+        class CountingFile(io.BytesIO):
+            bytes_read = 0
+            
+            def read(self, size=-1):
+                chunk = super().read(size)
+                self.bytes_read += len(chunk)
+                return chunk
+            
+            def readinto(self, buffer):
+                count = super().readinto(buffer)
+                self.bytes_read += count
+                return count
+        
+        f = CountingFile(data)
+        streamed = Firesand_Auth_Matrix._stream_postman(f)
+        assert streamed == convert_postman_to_authmatrix(postman_content)
+        assert f.bytes_read == len(data)
+
+
+    def test_load_spec_freezes_status_lists(self):
+        """Test list-valued expected statuses are loaded as frozensets"""
+        authmatrix_content = {
+            "base_url": "https://api.test.com",
+            "roles": {"user": {"auth": {"type": "none"}}},
+            "endpoints": [
+                {"name": "Create", "method": "POST", "path": "/create",
+                 "expect": {"user": {"status": [200, 201]}}},
+                {"name": "Read", "method": "GET", "path": "/read",
+                 "expect": {"user": {"status": 200}}}
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            f.write(f"{AUTHMATRIX_SHEBANG}\n" + json.dumps(authmatrix_content))
+            temp_file = f.name
+        
+        try:
+            result = load_and_convert_spec(temp_file)
+            assert result["endpoints"][0]["expect"]["user"]["status"] == frozenset({200, 201})
+            assert result["endpoints"][1]["expect"]["user"]["status"] == 200
+            
+            mock_response = MagicMock()
+            mock_response.status_code = 201
+            with patch('requests.Session.request', return_value=mock_response):
+                results = run_spec(result)
+            assert results["Create"]["user"]["status"] == "PASS"
+            assert results["Read"]["user"]["status"] == "FAIL"
+        finally:
+            os.unlink(temp_file)
+
+
 class TestRunSpec:
     """Test the run_spec function that executes API tests"""
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_run_spec_success(self, mock_request):
         """Test successful spec execution"""
         mock_response = MagicMock()
@@ -629,7 +761,7 @@ class TestRunSpec:
         assert guest_result["status"] == "FAIL"
         assert guest_result["http"] == 200
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_run_spec_with_list_status_codes(self, mock_request):
         """Test spec execution with list of acceptable status codes"""
         mock_response = MagicMock()
@@ -692,7 +824,7 @@ class TestRunSpec:
         assert admin_result["status"] == "FAIL"
         assert "error" in admin_result
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_run_spec_network_error(self, mock_request):
         """Test spec execution with network error"""
         mock_request.side_effect = ConnectionError("Network error")
@@ -748,6 +880,181 @@ class TestRunSpec:
         assert user_result["status"] == "FAIL"  # Will fail without mocking
 
 
+    @patch('requests.Session.request')
+    def test_run_spec_preserves_order(self, mock_request):
+        """Test concurrent execution keeps endpoint and role order from the spec"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+        
+        spec = {
+            "base_url": "https://api.test.com",
+            "roles": {
+                "guest": {"auth": {"type": "none"}},
+                "user": {"auth": {"type": "bearer", "token": "user-token"}},
+                "admin": {"auth": {"type": "bearer", "token": "admin-token"}}
+            },
+            "endpoints": [
+                {
+                    "name": f"Endpoint {i}",
+                    "method": "GET",
+                    "path": f"/e{i}",
+                    "expect": {"user": {"status": 200}, "admin": {"status": 200}}
+                }
+                for i in range(10)
+            ]
+        }
+        
+        results = run_spec(spec)
+        
+        assert list(results.keys()) == [f"Endpoint {i}" for i in range(10)]
+        for rmap in results.values():
+            assert list(rmap.keys()) == ["guest", "user", "admin"]
+            assert rmap["guest"]["status"] == "SKIP"
+            assert rmap["user"]["status"] == "PASS"
+            assert rmap["admin"]["status"] == "PASS"
+        assert mock_request.call_count == 20
+
+
+    @patch('requests.Session.request')
+    def test_run_spec_role_headers(self, mock_request):
+        """Test each role's auth header is applied without leaking to other roles"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+        
+        spec = {
+            "base_url": "https://api.test.com/",
+            "default_headers": {"Accept": "application/json"},
+            "roles": {
+                "guest": {"auth": {"type": "none"}},
+                "admin": {"auth": {"type": "bearer", "token": "admin-token"}}
+            },
+            "endpoints": [
+                {"name": f"E{i}", "method": "GET", "path": f"/e{i}",
+                 "expect": {"guest": {"status": 200}, "admin": {"status": 200}}}
+                for i in range(3)
+            ]
+        }
+        
+        run_spec(spec)
+        
+        seen = {}
+        for call in mock_request.call_args_list:
+            method, url = call.args
+            seen.setdefault(url, []).append(dict(call.kwargs["headers"]))
+        assert sorted(seen) == [f"https://api.test.com/e{i}" for i in range(3)]
+        for headers_list in seen.values():
+            assert {"Accept": "application/json"} in headers_list
+            assert {"Accept": "application/json", "Authorization": "Bearer admin-token"} in headers_list
+        assert spec["default_headers"] == {"Accept": "application/json"}
+    
+    def test_run_spec_respects_max_concurrency(self):
+        """Test no more than max_concurrency requests are in flight at once"""
+        import threading
+        import time as _time
+        
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        
+        def fake_request(*args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            _time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            response = MagicMock()
+            response.status_code = 200
+            return response
+        
+        spec = {
+            "base_url": "https://api.test.com",
+            "roles": {"user": {"auth": {"type": "none"}}},
+            "endpoints": [
+                {"name": f"E{i}", "method": "GET", "path": f"/e{i}",
+                 "expect": {"user": {"status": 200}}}
+                for i in range(12)
+            ]
+        }
+        
+        with patch('requests.Session.request', side_effect=fake_request):
+            results = run_spec(spec, max_concurrency=3)
+        
+        assert all(r["user"]["status"] == "PASS" for r in results.values())
+        assert 1 <= state["peak"] <= 3
+
+
+    def test_run_spec_pool_scales_to_max_concurrency(self):
+        """Test the worker pool isn't capped below max_concurrency"""
+        import threading
+        
+        count = 40
+        barrier = threading.Barrier(count, timeout=5)
+        
+        def fake_request(*args, **kwargs):
+            # Only succeeds if all requests are in flight at the same time
+            barrier.wait()
+            response = MagicMock()
+            response.status_code = 200
+            return response
+        
+        spec = {
+            "base_url": "https://api.test.com",
+            "roles": {"user": {"auth": {"type": "none"}}},
+            "endpoints": [
+                {"name": f"E{i}", "method": "GET", "path": f"/e{i}",
+                 "expect": {"user": {"status": 200}}}
+                for i in range(count)
+            ]
+        }
+        
+        with patch('requests.Session.request', side_effect=fake_request):
+            results = run_spec(spec, max_concurrency=count)
+        
+        assert all(r["user"]["status"] == "PASS" for r in results.values())
+    
+    def test_run_spec_does_not_share_cookies_between_roles(self):
+        """Test a cookie set during one check isn't sent with later checks"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                # /login hands out a session cookie; /me is only 200 with it
+                if self.path == "/login":
+                    self.send_response(200)
+                    self.send_header("Set-Cookie", "sid=admin; Path=/")
+                else:
+                    self.send_response(200 if self.headers.get("Cookie") else 401)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            spec = {
+                "base_url": f"http://127.0.0.1:{server.server_port}",
+                "roles": {"guest": {"auth": {"type": "none"}}},
+                "endpoints": [
+                    {"name": "login", "method": "GET", "path": "/login",
+                     "expect": {"guest": {"status": 200}}},
+                    {"name": "me", "method": "GET", "path": "/me",
+                     "expect": {"guest": {"status": 401}}},
+                ]
+            }
+            results = run_spec(spec, max_concurrency=1)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert results["login"]["guest"]["status"] == "PASS"
+        assert results["me"]["guest"]["status"] == "PASS"
+
+
 class TestPrintMatrix:
     """Test the print_matrix function that displays results"""
     
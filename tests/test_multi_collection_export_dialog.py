@@ -141,6 +141,67 @@ class TestMultiCollectionExportDialogRendering:
         assert len(text_edit.toPlainText()) > 0, "Text edit should contain JSON"
         assert '"info"' in text_edit.toPlainText(), "Text edit should show collection JSON"
 
+    def test_tab_json_loaded_when_tab_shown(self, qapp, qtbot):
+        """Test that a tab's JSON is only loaded once the tab is selected"""
+        collections = {
+            "admin": '{"info": {"name": "Admin Collection"}, "item": []}',
+            "user": '{"info": {"name": "User Collection"}, "item": []}',
+        }
+
+        dialog = MultiCollectionExportDialog(collections)
+        qtbot.addWidget(dialog)
+
+        tab_widget = dialog.findChild(QtWidgets.QTabWidget)
+        second_edit = tab_widget.widget(1).findChild(QtWidgets.QPlainTextEdit)
+        assert second_edit.toPlainText() == ""
+
+        tab_widget.setCurrentIndex(1)
+        assert "User Collection" in second_edit.toPlainText()
+
+    def test_large_collection_preview_on_request(self, qapp, qtbot):
+        """Test that a very large collection is only shown after Show JSON"""
+        from UI.UI import _LARGE_PREVIEW_CHARS
+
+        padding = "x" * _LARGE_PREVIEW_CHARS
+        collections = {
+            "admin": '{"info": {"name": "Admin Collection", "description": "%s"}, "item": []}' % padding,
+        }
+
+        dialog = MultiCollectionExportDialog(collections)
+        qtbot.addWidget(dialog)
+
+        text_edit = dialog.findChild(QtWidgets.QPlainTextEdit)
+        assert text_edit.toPlainText() == ""
+
+        show_btn = next(
+            btn for btn in dialog.findChildren(QtWidgets.QPushButton)
+            if btn.text().startswith("Show JSON")
+        )
+        show_btn.click()
+        assert '"Admin Collection"' in text_edit.toPlainText()
+
+    def test_save_all_collections_writes_in_background(self, qapp, qtbot, tmp_path):
+        """Test that Save All writes every collection off the GUI thread"""
+        collections = {
+            "guest": '{"info": {"name": "Guest Collection"}, "item": []}',
+            "admin": '{"info": {"name": "Admin Collection"}, "item": []}',
+        }
+
+        dialog = MultiCollectionExportDialog(collections)
+        qtbot.addWidget(dialog)
+
+        with patch.object(QtWidgets.QFileDialog, "getExistingDirectory", return_value=str(tmp_path)), \
+                patch.object(QtWidgets.QMessageBox, "information") as mock_info:
+            dialog._save_all_collections()
+            qtbot.waitUntil(lambda: mock_info.called, timeout=5000)
+
+        for role_name, collection_json in collections.items():
+            saved = tmp_path / f"{role_name}.postman_collection.json"
+            assert saved.read_text(encoding="utf-8") == collection_json
+        assert "Saved 2 Postman collection(s)" in mock_info.call_args[0][2]
+        assert dialog.isEnabled()
+        assert dialog.result() == QtWidgets.QDialog.Accepted
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
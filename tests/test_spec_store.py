@@ -29,6 +29,9 @@ class MockSignal:
 class MockQtCore:
     QObject = object  # Use real object as base class
     Signal = MockSignal
+    # Base class for UI/components models imported alongside SpecStore
+    QAbstractTableModel = object
+    QModelIndex = MagicMock
 
 
 mock_pyside6 = MagicMock()
@@ -40,7 +43,7 @@ sys.modules["PySide6.QtCore"] = MockQtCore()
 # Add the parent directory to the path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from UI.views.SpecStore import SpecStore, AUTHMATRIX_SHEBANG
+from UI.views.SpecStore import SpecStore, AUTHMATRIX_SHEBANG, _json_dumps, _json_dumps_pretty
 
 
 class TestSpecStore:
@@ -130,6 +133,51 @@ class TestSpecStore:
         assert self.store.spec["base_url"] == "https://plain.api.com"
         assert "user" in self.store.spec["roles"]
 
+    def test_load_spec_from_bytes(self):
+        """Test loading raw file bytes in both formats"""
+        authmatrix_bytes = (
+            AUTHMATRIX_SHEBANG + '\r\n{"base_url": "https://bytes.api.com", "roles": {}}'
+        ).encode("utf-8")
+        assert self.store.load_spec_from_content(authmatrix_bytes)
+        assert self.store.spec["base_url"] == "https://bytes.api.com"
+        assert self.store._original_postman_data is None
+
+        postman_bytes = json.dumps(
+            {
+                "info": {"name": "Bytes"},
+                "item": [{"name": "Ünïcode", "request": {"method": "GET", "url": "https://api.example.com/u"}}],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        assert self.store.load_spec_from_content(postman_bytes)
+        assert self.store.spec["endpoints"][0]["name"] == "Ünïcode"
+        assert self.store._original_postman_data is not None
+
+    def test_load_spec_invalid_bytes(self):
+        """Test loading invalid JSON bytes leaves the spec unchanged"""
+        assert not self.store.load_spec_from_content(b"{ invalid json")
+        assert self.store.spec["base_url"] == ""
+
+    def test_load_spec_from_json_dumps_round_trip(self):
+        """Test a merged spec serialized with _json_dumps loads back unchanged"""
+        merged = {
+            "base_url": "https://merged.api.com",
+            "default_headers": {"Accept": "application/json"},
+            "roles": {"guest": {"auth": {"type": "none"}}},
+            "endpoints": [{"name": "Ünïcode", "method": "GET", "path": "/u", "expect": {"guest": {"status": [200, 204]}}}],
+        }
+        data = _json_dumps(merged)
+        assert isinstance(data, bytes)
+        assert self.store.load_spec_from_content(data)
+        assert self.store.spec == merged
+
+    def test_json_dumps_pretty_matches_indented_json(self):
+        """Test exports are two-space indented JSON text with non-ASCII kept as is"""
+        data = {"name": "Ünïcode", "expect": {"guest": {"status": [200, 204]}}, "empty": {}}
+        text = _json_dumps_pretty(data)
+        assert isinstance(text, str)
+        assert text == json.dumps(data, indent=2, ensure_ascii=False)
+
     def test_is_postman_collection(self):
         """Test Postman collection detection"""
         # Valid Postman collection
@@ -597,6 +645,122 @@ admin/settings"""
         assert not success
         assert "Invalid endpoint index" in error
 
+    def test_has_configured_expectations(self):
+        """Test detection of endpoints with expectations"""
+        assert not self.store.has_configured_expectations()
+
+        self.store.spec["endpoints"] = [
+            {"name": "A", "method": "GET", "path": "/a"},
+            {"name": "B", "method": "GET", "path": "/b", "expect": {}},
+        ]
+        assert not self.store.has_configured_expectations()
+
+        self.store.spec["endpoints"].append(
+            {"name": "C", "method": "GET", "path": "/c", "expect": {"guest": {"status": 200}}}
+        )
+        assert self.store.has_configured_expectations()
+
+    def test_set_endpoint_expectations_bulk(self):
+        """Test bulk expectation updates emit specChanged once"""
+        self.store.add_role("admin", "bearer", "token")
+        self.store.spec["endpoints"] = [
+            {"name": "A", "method": "GET", "path": "/a", "expect": {}},
+            {"name": "B", "method": "GET", "path": "/b", "expect": {"guest": {"status": 500, "contains": ["x"]}}},
+        ]
+
+        with patch.object(self.store, "specChanged") as mock_signal:
+            success, error = self.store.set_endpoint_expectations_bulk(
+                [(0, "guest", 200), (0, "admin", 200), (1, "guest", 403)]
+            )
+
+            assert success
+            assert error is None
+            assert self.store.spec["endpoints"][0]["expect"] == {
+                "guest": {"status": 200},
+                "admin": {"status": 200},
+            }
+            assert self.store.spec["endpoints"][1]["expect"] == {"guest": {"status": 403}}
+            mock_signal.emit.assert_called_once()
+
+    def test_apply_auto_configuration(self):
+        """Test auto-configuration sets statuses by path category in one update"""
+        self.store.add_role("admin", "bearer", "token")
+        self.store.spec["endpoints"] = [
+            {"name": "Health", "method": "GET", "path": "/health"},
+            {"name": "Admin", "method": "GET", "path": "api/admin/users"},
+            {"name": "Account", "method": "GET", "path": "api/account"},
+            {"name": "Orders", "method": "GET", "path": "api/orders"},
+        ]
+
+        with patch.object(self.store, "specChanged") as mock_signal:
+            assert self.store.apply_auto_configuration() == 8
+            mock_signal.emit.assert_called_once()
+
+        statuses = [
+            {role: exp["status"] for role, exp in ep["expect"].items()}
+            for ep in self.store.spec["endpoints"]
+        ]
+        assert statuses == [
+            {"guest": 200, "admin": 200},
+            {"guest": 403, "admin": 200},
+            {"guest": 403, "admin": 200},
+            {"guest": 403, "admin": 200},
+        ]
+
+    def test_role_labels(self):
+        """Test role labels show the auth type and whether a token is set"""
+        self.store.add_role("admin", "bearer", "token")
+        assert self.store.role_labels() == [
+            "guest - none",
+            "admin - bearer (with token)",
+        ]
+
+    def test_set_endpoint_expectations_bulk_invalid(self):
+        """Test bulk updates are rejected as a whole on any invalid entry"""
+        self.store.spec["endpoints"] = [
+            {"name": "A", "method": "GET", "path": "/a", "expect": {}},
+        ]
+
+        with patch.object(self.store, "specChanged") as mock_signal:
+            success, error = self.store.set_endpoint_expectations_bulk(
+                [(0, "guest", 200), (5, "guest", 200)]
+            )
+            assert not success
+            assert "Invalid endpoint index" in error
+
+            success, error = self.store.set_endpoint_expectations_bulk(
+                [(0, "guest", 200), (0, "nobody", 200)]
+            )
+            assert not success
+            assert "does not exist" in error
+
+            assert self.store.spec["endpoints"][0]["expect"] == {}
+            mock_signal.emit.assert_not_called()
+
+    def test_pickled_spec_round_trip(self):
+        """Test pickled spec unpickles to the current spec"""
+        import pickle
+
+        self.store.set_base_url("https://api.test.com")
+        assert pickle.loads(self.store.pickled_spec()) == self.store.spec
+
+    def test_pickled_spec_cached_until_change(self):
+        """Test pickled spec is reused until the spec changes"""
+        first = self.store.pickled_spec()
+        assert self.store.pickled_spec() is first
+
+        self.store.set_base_url("https://changed.test.com")
+        second = self.store.pickled_spec()
+        assert second is not first
+        assert b"changed.test.com" in second
+
+    def test_pickled_spec_after_spec_replaced(self):
+        """Test pickled spec follows a reassigned spec dict"""
+        first = self.store.pickled_spec()
+        self.store.spec = {**self.store.spec, "base_url": "https://new.test.com"}
+        assert self.store.pickled_spec() is not first
+        assert b"new.test.com" in self.store.pickled_spec()
+
     def test_export_as_authmatrix(self):
         """Test exporting as AuthMatrix format"""
         self.store.spec["base_url"] = "https://api.test.com"
@@ -75,5 +75,117 @@ class TestTabsComponent:
         assert tokens is not None
 
 
+
+class TestEndpointTable:
+    """Test EndpointTableModel and ButtonDelegate"""
+
+    def test_model_reads_store_endpoints(self, qtbot):
+        """Test the model exposes endpoint name and method per row"""
+        from UI.components.EndpointTable import EndpointTableModel
+        from UI.views.SpecStore import SpecStore
+
+        store = SpecStore()
+        store.spec["endpoints"] = [
+            {"name": "List", "method": "GET", "path": "/items"},
+            {"name": "Create", "method": "POST", "path": "/items"},
+        ]
+        model = EndpointTableModel(store)
+
+        assert model.rowCount() == 2
+        assert model.columnCount() == 3
+        assert model.index(1, 0).data() == "Create"
+        assert model.index(1, 1).data() == "POST"
+
+    def test_model_follows_spec_changes(self, qtbot):
+        """Test the model picks up endpoints added through the store"""
+        from UI.components.EndpointTable import EndpointTableModel
+        from UI.views.SpecStore import SpecStore
+
+        store = SpecStore()
+        model = EndpointTableModel(store)
+        assert model.rowCount() == 0
+
+        store.spec["endpoints"].append({"name": "New", "method": "GET", "path": "/new"})
+        store.specChanged.emit()
+        assert model.rowCount() == 1
+
+    def test_button_delegate_emits_row(self, qtbot):
+        """Test clicking a painted button emits its row"""
+        from PySide6 import QtCore, QtTest, QtWidgets
+        from UI.components.EndpointTable import EndpointTableModel, ButtonDelegate
+        from UI.views.SpecStore import SpecStore
+
+        store = SpecStore()
+        store.spec["endpoints"] = [
+            {"name": f"E{i}", "method": "GET", "path": f"/e{i}"} for i in range(3)
+        ]
+        view = QtWidgets.QTableView()
+        qtbot.addWidget(view)
+        view.setModel(EndpointTableModel(store, view))
+        delegate = ButtonDelegate("Configure", view)
+        view.setItemDelegateForColumn(2, delegate)
+        view.show()
+
+        clicked = []
+        delegate.clicked.connect(clicked.append)
+        rect = view.visualRect(view.model().index(2, 2))
+        QtTest.QTest.mouseClick(
+            view.viewport(), QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, rect.center()
+        )
+        assert clicked == [2]
+
+    def test_button_delegate_ignores_cell_margin(self, qtbot):
+        """Test a click in the cell but outside the painted button does nothing"""
+        from PySide6 import QtCore, QtTest, QtWidgets
+        from UI.components.EndpointTable import EndpointTableModel, ButtonDelegate
+        from UI.views.SpecStore import SpecStore
+
+        store = SpecStore()
+        store.spec["endpoints"] = [{"name": "E0", "method": "GET", "path": "/e0"}]
+        view = QtWidgets.QTableView()
+        qtbot.addWidget(view)
+        view.setModel(EndpointTableModel(store, view))
+        delegate = ButtonDelegate("Configure", view)
+        view.setItemDelegateForColumn(2, delegate)
+        view.show()
+
+        clicked = []
+        delegate.clicked.connect(clicked.append)
+        rect = view.visualRect(view.model().index(0, 2))
+        margin = QtCore.QPoint(rect.left() + 1, rect.center().y())
+        QtTest.QTest.mouseClick(
+            view.viewport(), QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, margin
+        )
+        assert clicked == []
+
+    @pytest.mark.parametrize("key", ["Key_Space", "Key_Return", "Key_Enter"])
+    def test_button_delegate_keyboard_activation(self, qtbot, key):
+        """Test Space/Return/Enter on the focused button cell emits its row"""
+        from PySide6 import QtCore, QtTest, QtWidgets
+        from UI.components.EndpointTable import EndpointTableModel, ButtonDelegate
+        from UI.views.SpecStore import SpecStore
+
+        store = SpecStore()
+        store.spec["endpoints"] = [
+            {"name": f"E{i}", "method": "GET", "path": f"/e{i}"} for i in range(3)
+        ]
+        view = QtWidgets.QTableView()
+        qtbot.addWidget(view)
+        view.setModel(EndpointTableModel(store, view))
+        delegate = ButtonDelegate("Configure", view)
+        view.setItemDelegateForColumn(2, delegate)
+        view.show()
+
+        clicked = []
+        delegate.clicked.connect(clicked.append)
+        view.setCurrentIndex(view.model().index(1, 0))
+        QtTest.QTest.keyClick(view, getattr(QtCore.Qt, key))
+        assert clicked == []
+
+        view.setCurrentIndex(view.model().index(1, 2))
+        QtTest.QTest.keyClick(view, getattr(QtCore.Qt, key))
+        assert clicked == [1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -266,6 +266,32 @@ class TestEndpointsSection:
         # Check that Configure column (index 3) is set to Fixed mode
         assert header.sectionResizeMode(3) == QtWidgets.QHeaderView.Fixed
 
+    def test_configure_all_endpoints_button_column_not_editable(self, qtbot):
+        """Test that keys on the Configure column don't open a text editor"""
+        from UI.views.Endpoints import ConfigureAllEndpointsDialog
+        from UI.views.SpecStore import SpecStore
+        from PySide6 import QtWidgets, QtCore
+        from PySide6.QtTest import QTest
+
+        store = SpecStore()
+        store.spec["endpoints"] = [
+            {"name": "Test", "method": "GET", "path": "/test"}
+        ]
+
+        dialog = ConfigureAllEndpointsDialog(store)
+        qtbot.addWidget(dialog)
+        dialog.show()
+
+        table = dialog.endpoints_table
+        assert table.editTriggers() == QtWidgets.QAbstractItemView.NoEditTriggers
+
+        table.setCurrentIndex(table.model().index(0, 3))
+        QTest.keyClick(table, QtCore.Qt.Key_F2)
+        QTest.keyClick(table, QtCore.Qt.Key_X)
+
+        assert table.state() != QtWidgets.QAbstractItemView.EditingState
+        assert table.item(0, 3) is None
+
 
 class TestResultsSection:
     """Test Results view"""
@@ -279,5 +305,89 @@ class TestResultsSection:
         assert results is not None
 
 
+class TestEndpointConfigDialog:
+    """Test EndpointConfigDialog status parsing"""
+
+    def test_parse_status_accepts_decimal_codes(self, qtbot):
+        """Test ints, leading zeros and lists of codes are accepted"""
+        from UI.UI import _parse_status
+
+        assert _parse_status("200") == 200
+        assert _parse_status("0200") == 200
+        assert _parse_status(" [200, 201] ") == [200, 201]
+        assert _parse_status("[]") == []
+
+    @pytest.mark.parametrize("text", [
+        "0x1F", "1_000", "[{[]}]", "[" * 10000 + "]" * 10000,
+        "[200,]", "[200 201]", "abc", "-200",
+    ])
+    def test_parse_status_rejects_invalid(self, qtbot, text):
+        """Test non-decimal or malformed input raises ValueError"""
+        from UI.UI import _parse_status
+
+        with pytest.raises(ValueError):
+            _parse_status(text)
+
+    def test_save_config_warns_on_invalid_status(self, qtbot, monkeypatch):
+        """Test an invalid status shows a warning instead of raising"""
+        from UI.UI import EndpointConfigDialog
+        from UI.views.SpecStore import SpecStore
+        from PySide6 import QtWidgets
+
+        store = SpecStore()
+        store.spec["endpoints"] = [{"name": "Test", "method": "GET", "path": "/test"}]
+
+        dialog = EndpointConfigDialog(store, 0)
+        qtbot.addWidget(dialog)
+
+        warnings = []
+        monkeypatch.setattr(
+            QtWidgets.QMessageBox, "warning",
+            lambda parent, title, message: warnings.append(title),
+        )
+
+        dialog.role_configs["guest"]["status"].setText("[{[]}]")
+        dialog._save_config()
+
+        assert warnings == ["Invalid Status"]
+        assert "expect" not in store.spec["endpoints"][0]
+
+
+class TestCheckEndpoint:
+    """Test the per-endpoint check run by the streaming worker"""
+
+    def test_latency_includes_body(self):
+        """Test latency_ms covers reading the body, not just the headers"""
+        import threading
+        import time
+        from UI.UI import _check_endpoint
+
+        class SlowBodyResponse:
+            status_code = 200
+            headers = {}
+
+            def iter_content(self, chunk_size):
+                time.sleep(0.05)
+                yield b"{}"
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        class Session:
+            def request(self, *args, **kwargs):
+                return SlowBodyResponse()
+
+        name, role, result = _check_endpoint(
+            Session(), "Test", "guest", "GET", "http://api.test/x", {},
+            frozenset({200}), threading.Event(),
+        )
+
+        assert result["status"] == "PASS"
+        assert result["latency_ms"] >= 50
+
+
 if __name__ == "__main__":
     pytest.main([__file__])